@@ -43,6 +43,13 @@ class VoiceConfig:
     stt_model: str = "base"
     tts_engine: str = "silero"
     tts_voice: str = "en_v6"
+    tts_sample_rate: int = 24000
+    tts_cache_mb: int = 64
+    precache_phrases: list = field(default_factory=lambda: [
+        "Offline mode enabled",
+        "Conversation history cleared",
+        "Shutting down Jarvis. Goodbye!"
+    ])
     audio_device: Optional[str] = None
     sample_rate: int = 16000
     chunk_size: int = 1024
@@ -113,6 +120,7 @@ class UIConfig:
     system_tray: bool = True
     startup_notification: bool = True
     minimize_to_tray: bool = True
+    max_chat_lines: int = 2000
 
 
 @dataclass
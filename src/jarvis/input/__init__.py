@@ -2,7 +2,14 @@
 Input handling modules for Jarvis AI Assistant.
 """
 
-from .voice_handler import VoiceHandler
 from .text_handler import TextHandler
 
 __all__ = ["VoiceHandler", "TextHandler"]
+
+
+def __getattr__(name):
+    # VoiceHandler pulls in the audio/STT stack, so load it on first use
+    if name == "VoiceHandler":
+        from .voice_handler import VoiceHandler
+        return VoiceHandler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,7 +5,8 @@ Handles hotkey detection and text input popup.
 
 import asyncio
 import threading
-from typing import Optional
+from typing import Optional, Callable
+import _tkinter
 import tkinter as tk
 from tkinter import ttk
 import keyboard
@@ -21,16 +22,20 @@ logger = get_logger("text_handler")
 class TextInputPopup:
     """Text input popup window."""
     
-    def __init__(self):
+    def __init__(self, parent=None, on_result: Optional[Callable] = None):
+        self.parent = parent
+        self.on_result = on_result
         self.root = None
         self.text_var = None
-        self.result_queue = queue.Queue()
+        # Only standalone popups (show_and_wait) need a queue to hand back the result
+        self.result_queue = None if on_result else queue.Queue()
         self.is_open = False
     
     def create_popup(self) -> None:
         """Create and show the text input popup."""
         try:
-            self.root = tk.Tk()
+            # Reuse the existing Tk interpreter when a parent window is available
+            self.root = tk.Toplevel(self.parent) if self.parent else tk.Tk()
             self.root.title("Jarvis - Text Input")
             self.root.geometry("500x150")
             self.root.resizable(False, False)
@@ -44,10 +49,11 @@ class TextInputPopup:
             # Always on top
             self.root.attributes("-topmost", True)
             
-            # Configure style
-            style = ttk.Style()
+            # Configure style (ttk styles are interpreter-wide, so leave a parent's theme alone)
             if config.ui.theme == "dark":
                 self.root.configure(bg="#2b2b2b")
+            if config.ui.theme == "dark" and not self.parent:
+                style = ttk.Style()
                 style.theme_use("clam")
                 style.configure("TLabel", background="#2b2b2b", foreground="white")
                 style.configure("TEntry", fieldbackground="#404040", foreground="white")
@@ -110,10 +116,7 @@ class TextInputPopup:
         """Handle send button click."""
         try:
             text = self.text_var.get().strip()
-            if text:
-                self.result_queue.put(text)
-            else:
-                self.result_queue.put(None)
+            self._deliver(text or None)
             self._close_popup()
         except Exception as e:
             logger.error(f"Error in send handler: {e}")
@@ -122,7 +125,7 @@ class TextInputPopup:
     def _on_cancel(self) -> None:
         """Handle cancel button click."""
         try:
-            self.result_queue.put(None)
+            self._deliver(None)
             self._close_popup()
         except Exception as e:
             logger.error(f"Error in cancel handler: {e}")
@@ -134,12 +137,21 @@ class TextInputPopup:
             logger.debug("Text input popup timed out")
             self._on_cancel()
     
+    def _deliver(self, result: Optional[str]) -> None:
+        """Hand the popup result to the waiting caller."""
+        if self.on_result:
+            self.on_result(result)
+        else:
+            self.result_queue.put(result)
+    
     def _close_popup(self) -> None:
         """Close the popup window."""
         try:
             self.is_open = False
             if self.root:
-                self.root.quit()
+                # A child window has no mainloop of its own to stop
+                if not self.parent:
+                    self.root.quit()
                 self.root.destroy()
                 self.root = None
         except Exception as e:
@@ -228,12 +240,17 @@ class TextHandler:
         self.input_queue = queue.Queue()
         self.initialized = False
         self.running = False
+        self._loop = None
+        self._tk_parent = None
+        self._own_root = None
     
     async def initialize(self) -> bool:
         """Initialize text input handler."""
         try:
             logger.info("Initializing text input handler...")
             
+            self._loop = asyncio.get_running_loop()
+            
             # Register hotkey
             if not self.hotkey_manager.register_hotkey(self._on_hotkey_activated):
                 logger.error("Failed to register hotkey")
@@ -257,31 +274,59 @@ class TextHandler:
             
             logger.debug("Text input hotkey activated")
             
-            # Run popup in separate thread to avoid blocking
-            def show_popup():
-                try:
-                    popup = TextInputPopup()
-                    result = popup.show_and_wait()
-                    
-                    if result:
-                        # Validate input length
-                        if len(result) > config.input.max_input_length:
-                            logger.warning(f"Input too long: {len(result)} characters")
-                            result = result[:config.input.max_input_length]
-                        
-                        self.input_queue.put(result)
-                        logger.debug(f"Text input received: {result}")
-                    
-                except Exception as e:
-                    logger.error(f"Error in popup thread: {e}")
-            
-            # Start popup thread
-            popup_thread = threading.Thread(target=show_popup, daemon=True)
-            popup_thread.start()
+            # Tk is only touched from the event loop's thread; hand over from the hotkey thread
+            if self._loop and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._open_popup)
             
         except Exception as e:
             logger.error(f"Error handling hotkey activation: {e}")
     
+    def set_tk_parent(self, provider: Optional[Callable]) -> None:
+        """Set a callable returning the Tk window popups should be parented to (or None)."""
+        self._tk_parent = provider
+    
+    def _open_popup(self) -> None:
+        """Show the popup as a Toplevel of an existing Tk root on the loop thread."""
+        try:
+            parent = self._tk_parent() if self._tk_parent else None
+            popup = TextInputPopup(parent=parent or self._get_own_root(), on_result=self._accept_input)
+            popup.create_popup()
+            
+            # Nobody else pumps our hidden root, so drive it while the popup is open
+            if parent is None and popup.is_open:
+                self._loop.create_task(self._pump_own_root(popup))
+        except Exception as e:
+            logger.error(f"Error opening text input popup: {e}")
+    
+    def _get_own_root(self):
+        """Return a hidden Tk root owned by this handler, creating it on first use."""
+        if self._own_root is None:
+            self._own_root = tk.Tk()
+            self._own_root.withdraw()
+        return self._own_root
+    
+    async def _pump_own_root(self, popup: "TextInputPopup") -> None:
+        """Process Tk events for a popup parented to the hidden root until it closes."""
+        try:
+            while popup.is_open and self._own_root is not None:
+                dooneevent = self._own_root.tk.dooneevent
+                while dooneevent(_tkinter.ALL_EVENTS | _tkinter.DONT_WAIT):
+                    pass
+                await asyncio.sleep(0.01)
+        except Exception as e:
+            logger.error(f"Error processing popup events: {e}")
+    
+    def _accept_input(self, result: Optional[str]) -> None:
+        """Validate popup input and queue it for the assistant."""
+        if result:
+            # Validate input length
+            if len(result) > config.input.max_input_length:
+                logger.warning(f"Input too long: {len(result)} characters")
+                result = result[:config.input.max_input_length]
+            
+            self.input_queue.put(result)
+            logger.debug(f"Text input received: {result}")
+    
     async def wait_for_input(self) -> Optional[str]:
         """Wait for text input from user."""
         if not self.initialized or not self.running:
@@ -313,7 +358,8 @@ class TextHandler:
     
     def clear_pending_input(self) -> None:
         """Clear any pending input."""
-        while not self.input_queue.empty():
+        # Drain in one pass; empty() is racy and costs an extra lock round-trip per item
+        while True:
             try:
                 self.input_queue.get_nowait()
             except queue.Empty:
@@ -332,6 +378,13 @@ class TextHandler:
         # Clear input queue
         self.clear_pending_input()
         
+        if self._own_root is not None:
+            try:
+                self._own_root.destroy()
+            except Exception as e:
+                logger.error(f"Error destroying popup root: {e}")
+            self._own_root = None
+        
         self.initialized = False
         
         logger.info("Text input handler cleanup complete")
@@ -105,14 +105,14 @@ class JarvisAssistant:
         if not config.voice.enabled:
             self.ui_manager.show_chat_window()
         
+        # Open hotkey popups as child windows of the chat window's Tk root
+        if self.text_handler:
+            self.text_handler.set_tk_parent(self._chat_root)
+        
         # Set up UI callbacks
         self.ui_manager.set_message_callback(self._process_user_input)
         self.ui_manager.set_shutdown_callback(self.shutdown)
         
-        # Start GUI event processing
-        if self.ui_manager.chat_window and self.ui_manager.chat_window.root:
-            self._setup_gui_integration()
-        
         try:
             # Start background tasks
             tasks = []
@@ -205,7 +205,7 @@ class JarvisAssistant:
                 try:
                     # Process UI events
                     await self.ui_manager.process_events()
-                    await asyncio.sleep(0.1)  # Small delay to prevent busy waiting
+                    await asyncio.sleep(self.ui_manager.tick_interval)
                 
                 except Exception as e:
                     logger.error(f"Error in UI management: {e}")
@@ -463,26 +463,12 @@ class JarvisAssistant:
         
         return False
     
-    def _setup_gui_integration(self) -> None:
-        """Setup integration between async loop and GUI."""
-        try:
-            if self.ui_manager.chat_window and self.ui_manager.chat_window.root:
-                # Schedule periodic GUI updates
-                def update_gui():
-                    try:
-                        if self.running and self.ui_manager.chat_window.root:
-                            self.ui_manager.chat_window.root.update()
-                            # Schedule next update
-                            self.ui_manager.chat_window.root.after(100, update_gui)
-                    except Exception as e:
-                        logger.error(f"Error in GUI update: {e}")
-                
-                # Start GUI update cycle
-                self.ui_manager.chat_window.root.after(100, update_gui)
-                logger.info("GUI integration setup complete")
-                
-        except Exception as e:
-            logger.error(f"Error setting up GUI integration: {e}")
+    def _chat_root(self):
+        """Return the open chat window's Tk root, if any."""
+        chat_window = self.ui_manager.chat_window if self.ui_manager else None
+        if chat_window and chat_window.is_open:
+            return chat_window.root
+        return None
     
     def shutdown(self) -> None:
         """Shutdown the assistant."""
@@ -5,25 +5,72 @@ Main entry point for Jarvis AI Assistant with PyQt6 GUI.
 import sys
 import signal
 import asyncio
-from pathlib import Path
-from typing import Optional
-import uuid
+
+# Optional libuv-backed event loop (uvloop on POSIX, winloop on Windows)
+try:
+    import uvloop as fast_loop
+except ImportError:
+    try:
+        import winloop as fast_loop
+    except ImportError:
+        fast_loop = None
+
+# Optional Qt-backed asyncio loop, so Qt events are dispatched natively instead of polled
+try:
+    import qasync
+except ImportError:
+    qasync = None
 
 from .core.config import config
 from .core.logging import setup_logging, get_logger
 from .core.ai_engine import ai_engine
-from .input.voice_handler import VoiceHandler
 from .input.text_handler import TextHandler
-from .output.tts_engine import TTSEngine
-from .output.ui_manager_pyqt import UIManager
+from .output.ui_manager_pyqt import UIManager, create_application
 from .tools.action_dispatcher import ActionDispatcher
 
 logger = get_logger("main_pyqt")
 
+# Exact-match shutdown commands (hash lookup instead of a per-call list)
+_EXIT_CMDS = frozenset(("exit", "quit", "shutdown", "stop"))
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+_SIZE_THRESHOLDS = (1 << 10, 1 << 20, 1 << 30, 1 << 40)
+
+# Listings at least this long are formatted in one vectorized pass
+_BULK_FORMAT_MIN_FILES = 1000
+
+# Constant error/confirmation responses
+_CONFIRM_DELETE_MSG = (
+    "⚠️ **Confirmation Required**\n\n"
+    "Are you sure you want to delete this item? This action cannot be undone "
+    "(though a backup will be created).\n\n"
+    "To confirm, please say: **'delete [filename] confirm'**"
+)
+_GENERIC_CONFIRM_MSG = "This operation requires confirmation. Please add 'confirm' to your request to proceed."
+_GENERIC_ERROR_MSG = "I apologize, but I encountered an error processing your request."
+
+# Static response skeletons, formatted with a single str.format call
+_FILE_ANALYSIS_TMPL = (
+    "**File Analysis: {name}**\n\n"
+    "📄 **Size:** {size}\n"
+    "🏷️ **Type:** {type}\n"
+)
+_SYS_INFO_TMPL = (
+    "**System Information:**\n\n"
+    "🖥️ **CPU Usage:** {cpu:.1f}%\n"
+    "💾 **Memory:** {mem_used:.1f}GB / {mem_total:.1f}GB ({mem_pct:.1f}%)\n"
+    "💿 **Disk:** {disk_used:.1f}GB / {disk_total:.1f}GB ({disk_pct:.1f}%)\n"
+)
+
 
 class JarvisAssistant:
     """Main Jarvis AI Assistant application with PyQt6 GUI."""
     
+    __slots__ = (
+        "running", "session_id", "voice_handler", "text_handler",
+        "tts_engine", "ui_manager", "action_dispatcher"
+    )
+    
     def __init__(self):
         self.running = False
         self.session_id = None
@@ -63,15 +110,24 @@ class JarvisAssistant:
             if not model_status.get('models_ready'):
                 logger.warning("Some models are not available. Functionality may be limited.")
             
-            # Initialize components
+            # Initialize components (audio backends are imported only when enabled)
             if config.voice.enabled:
+                from .input.voice_handler import VoiceHandler
                 self.voice_handler = VoiceHandler()
             else:
                 logger.info("Voice features disabled in configuration")
                 self.voice_handler = None
             
             self.text_handler = TextHandler()
-            self.tts_engine = TTSEngine()
+            
+            if config.output.speak_responses:
+                from .output.tts_engine import TTSEngine
+                self.tts_engine = TTSEngine()
+                self.tts_engine.start_initialization()  # Loads models in the background
+            else:
+                logger.info("Spoken responses disabled in configuration")
+                self.tts_engine = None
+            
             self.ui_manager = UIManager()
             self.action_dispatcher = ActionDispatcher()
             
@@ -200,9 +256,9 @@ class JarvisAssistant:
         try:
             while self.running:
                 try:
-                    # Process PyQt6 events
+                    # Process PyQt6 events (only polled when the loop is not qasync's)
                     await self.ui_manager.process_events()
-                    await asyncio.sleep(0.01)  # Small delay for smooth UI
+                    await asyncio.sleep(self.ui_manager.tick_interval)
                 
                 except Exception as e:
                     logger.error(f"Error in UI management: {e}")
@@ -217,7 +273,8 @@ class JarvisAssistant:
             logger.info(f"Processing {input_type} input: {user_input}")
             
             # Check for special commands
-            if await self._handle_special_commands(user_input):
+            input_lower = user_input.lower().strip()
+            if await self._handle_special_commands(user_input, input_lower):
                 return
             
             # Check if input requires action
@@ -235,9 +292,9 @@ class JarvisAssistant:
                     if "requires confirmation" in error_msg.lower():
                         # For delete operations, provide clear confirmation prompt
                         if "delete" in action_result.get('action_taken', '').lower():
-                            response = f"⚠️ **Confirmation Required**\n\nAre you sure you want to delete this item? This action cannot be undone (though a backup will be created).\n\nTo confirm, please say: **'delete [filename] confirm'**"
+                            response = _CONFIRM_DELETE_MSG
                         else:
-                            response = f"This operation requires confirmation. Please add 'confirm' to your request to proceed."
+                            response = _GENERIC_CONFIRM_MSG
                     else:
                         # Other errors - provide helpful response without passing to AI
                         response = f"I couldn't complete that action: {error_msg}"
@@ -265,7 +322,7 @@ class JarvisAssistant:
             
         except Exception as e:
             logger.error(f"Error processing user input: {e}")
-            error_response = "I apologize, but I encountered an error processing your request."
+            error_response = _GENERIC_ERROR_MSG
             
             if config.output.speak_responses and self.tts_engine:
                 try:
@@ -276,9 +333,8 @@ class JarvisAssistant:
             if self.ui_manager:
                 self.ui_manager.show_response(user_input, error_response)
     
-    async def _handle_special_commands(self, user_input: str) -> bool:
-        """Handle special system commands."""
-        input_lower = user_input.lower().strip()
+    async def _handle_special_commands(self, user_input: str, input_lower: str) -> bool:
+        """Handle special system commands (input_lower is the normalized user_input)."""
         
         # Online/offline mode toggle
         if "enable online mode" in input_lower or "go online" in input_lower:
@@ -307,7 +363,7 @@ class JarvisAssistant:
             return True
         
         # System commands
-        if input_lower in ["exit", "quit", "shutdown", "stop"]:
+        if input_lower in _EXIT_CMDS:
             response = "Shutting down Jarvis. Goodbye!"
             if self.tts_engine:
                 try:
@@ -372,9 +428,12 @@ class JarvisAssistant:
         
         if files:
             response += "**Files:**\n"
-            for file in files:
-                size = self._format_file_size(file.get('size', 0))
-                response += f"📄 {file['name']} ({size})\n"
+            if len(files) >= _BULK_FORMAT_MIN_FILES:
+                response += self._format_file_lines_bulk(files)
+            else:
+                for file in files:
+                    size = self._format_file_size(file.get('size', 0))
+                    response += f"📄 {file['name']} ({size})\n"
         
         if not files and not directories:
             response += "The directory is empty."
@@ -383,6 +442,18 @@ class JarvisAssistant:
         
         return response
     
+    def _format_file_lines_bulk(self, files: list) -> str:
+        """Format file listing lines for large directories using numpy."""
+        import numpy as np
+        
+        sizes = np.fromiter((f.get('size', 0) for f in files), dtype=np.int64, count=len(files))
+        unit_idx = np.searchsorted(_SIZE_THRESHOLDS, sizes, side='right')
+        mantissas = (sizes / np.power(1024.0, unit_idx)).tolist()
+        units = [_SIZE_UNITS[i] for i in unit_idx.tolist()]
+        names = [f['name'] for f in files]
+        
+        return "".join(map("📄 {} ({:.1f} {})\n".format, names, mantissas, units))
+    
     def _format_screenshot_analysis_response(self, result_data: dict) -> str:
         """Format screenshot analysis response."""
         if not result_data.get('success'):
@@ -418,9 +489,11 @@ class JarvisAssistant:
         size = self._format_file_size(result_data.get('size', 0))
         extension = result_data.get('extension', '')
         
-        response = f"**File Analysis: {name}**\n\n"
-        response += f"📄 **Size:** {size}\n"
-        response += f"🏷️ **Type:** {extension.upper() if extension else 'Unknown'}\n"
+        response = _FILE_ANALYSIS_TMPL.format(
+            name=name,
+            size=size,
+            type=extension.upper() if extension else 'Unknown'
+        )
         
         if result_data.get('content_preview'):
             response += f"\n**Content Preview:**\n```\n{result_data['content_preview'][:200]}...\n```"
@@ -461,20 +534,21 @@ class JarvisAssistant:
         memory = result_data.get('memory', {})
         disk = result_data.get('disk', {})
         
-        response = "**System Information:**\n\n"
-        response += f"🖥️ **CPU Usage:** {cpu.get('usage_percent', 0):.1f}%\n"
-        response += f"💾 **Memory:** {memory.get('used_gb', 0):.1f}GB / {memory.get('total_gb', 0):.1f}GB ({memory.get('percent', 0):.1f}%)\n"
-        response += f"💿 **Disk:** {disk.get('used_gb', 0):.1f}GB / {disk.get('total_gb', 0):.1f}GB ({disk.get('percent', 0):.1f}%)\n"
-        
-        return response
+        return _SYS_INFO_TMPL.format(
+            cpu=cpu.get('usage_percent', 0),
+            mem_used=memory.get('used_gb', 0),
+            mem_total=memory.get('total_gb', 0),
+            mem_pct=memory.get('percent', 0),
+            disk_used=disk.get('used_gb', 0),
+            disk_total=disk.get('total_gb', 0),
+            disk_pct=disk.get('percent', 0)
+        )
     
     def _format_file_size(self, size_bytes: int) -> str:
         """Format file size in human readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        # Unit index straight from the bit length: one step per 2**10
+        idx = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
     
     def shutdown(self) -> None:
         """Shutdown the assistant."""
@@ -528,7 +602,14 @@ async def main():
 def cli_main():
     """CLI entry point for setup.py."""
     try:
-        asyncio.run(main())
+        if qasync is not None:
+            # Qt and asyncio share one loop; the QApplication must exist before it
+            create_application()
+            qasync.run(main())
+        elif fast_loop is not None:
+            fast_loop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\nShutdown complete.")
     except Exception as e:
@@ -2,7 +2,16 @@
 Output handling modules for Jarvis AI Assistant.
 """
 
-from .tts_engine import TTSEngine
-from .ui_manager import UIManager
-
 __all__ = ["TTSEngine", "UIManager"]
+
+
+def __getattr__(name):
+    # TTSEngine pulls in the audio/TTS model stack, so load it on first use
+    if name == "TTSEngine":
+        from .tts_engine import TTSEngine
+        return TTSEngine
+    # UIManager imports tkinter-backed modules, so keep it out of package import
+    if name == "UIManager":
+        from .ui_manager import UIManager
+        return UIManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
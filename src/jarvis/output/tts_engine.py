@@ -4,14 +4,24 @@ Supports multiple TTS backends including Silero, Bark, and pyttsx3.
 """
 
 import asyncio
+import atexit
+import contextlib
+import hashlib
 import io
+import os
+import re
+import shutil
+import subprocess
+import sys
 import tempfile
 import threading
-from typing import Optional, Dict, Any
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, Tuple
 import numpy as np
 import sounddevice as sd
-import queue
 import time
+from collections import deque, OrderedDict
 from pathlib import Path
 
 try:
@@ -34,20 +44,59 @@ try:
 except ImportError:
     PYTTSX3_AVAILABLE = False
 
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
+
 from ..core.config import config
 from ..core.logging import get_logger, log_performance
 
 logger = get_logger("tts_engine")
 
+SILERO_HUB_REPO = 'snakers4/silero-models'
+SILERO_HUB_CACHE_NAME = 'snakers4_silero-models_master'
+SILERO_SAMPLE_RATES = frozenset((8000, 24000, 48000))
+
+# Speech is synthesized and played one chunk at a time
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+WHITESPACE_RE = re.compile(r'\s+')
+MAX_CHUNK_CHARS = 200
+
+# Dedicated pool for TTS model loading, synthesis and cache I/O, so these jobs
+# don't compete with the default executor used elsewhere in the app
+_TTS_EXECUTOR = ThreadPoolExecutor(max_workers=max(2, (os.cpu_count() or 4) // 2), thread_name_prefix="tts-io")
+atexit.register(_TTS_EXECUTOR.shutdown, wait=False)
+
+TTS_CACHE_DIR = Path("jarvis/temp/cache/tts")
+TTS_CACHE_MEMORY_ITEMS = 64
+
+
+def _peak_amplitude(audio: np.ndarray) -> float:
+    """Peak absolute amplitude without allocating an abs() temporary."""
+    if audio.size == 0:
+        return 0.0
+    return float(max(audio.max(), -audio.min()))
+
 
 class SileroTTS:
     """Silero TTS implementation."""
     
+    # Output is already within [-1, 1]; playback can skip its peak scan
+    normalized_output = True
+    
     def __init__(self):
         self.model = None
         self.device = None
-        self.sample_rate = 48000
+        
+        # Synthesize at the playback rate directly rather than resampling later
+        self.sample_rate = config.voice.tts_sample_rate
+        if self.sample_rate not in SILERO_SAMPLE_RATES:
+            logger.warning(f"Unsupported Silero sample rate {self.sample_rate}, using 48000")
+            self.sample_rate = 48000
         self.initialized = False
+        self._amp = False
     
     async def initialize(self) -> bool:
         """Initialize Silero TTS."""
@@ -58,18 +107,22 @@ class SileroTTS:
             
             # Set device
             self.device = torch.device('cuda' if torch.cuda.is_available() and config.performance.gpu_acceleration else 'cpu')
+            if self.device.type == 'cpu':
+                self._configure_cpu_threads()
             
             # Load model
             model_name = 'v3_en'  # English model
-            self.model, _ = torch.hub.load(
-                repo_or_dir='snakers4/silero-models',
-                model='silero_tts',
-                language='en',
-                speaker=model_name
-            )
+            loop = asyncio.get_running_loop()
+            self.model = await loop.run_in_executor(_TTS_EXECUTOR, self._load_model, model_name)
             
             self.model.to(self.device)
             
+            # Mixed precision on GPU; CPU stays in FP32
+            self._amp = self.device.type == 'cuda'
+            
+            # Warm up so the first real request doesn't pay kernel selection cost
+            await loop.run_in_executor(_TTS_EXECUTOR, self._synthesize_sync, "warmup", config.voice.tts_voice)
+            
             logger.info(f"Silero TTS initialized on {self.device}")
             self.initialized = True
             return True
@@ -78,6 +131,37 @@ class SileroTTS:
             logger.error(f"Failed to initialize Silero TTS: {e}")
             return False
     
+    def _configure_cpu_threads(self) -> None:
+        """Size torch's CPU thread pools for single-utterance inference."""
+        threads = config.performance.cpu_threads or min(4, os.cpu_count() or 1)
+        torch.set_num_threads(threads)
+        try:
+            # Only allowed before any inter-op parallel work has started
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass
+    
+    def _load_model(self, model_name: str):
+        """Load the Silero model, preferring the local torch.hub checkout."""
+        hub_kwargs = dict(model='silero_tts', language='en', speaker=model_name)
+        
+        # Loading from the cached repo skips GitHub lookups and works offline
+        cache_dir = Path(torch.hub.get_dir()) / SILERO_HUB_CACHE_NAME
+        if cache_dir.exists():
+            try:
+                model, _ = torch.hub.load(repo_or_dir=str(cache_dir), source='local', **hub_kwargs)
+                return model
+            except Exception as e:
+                logger.warning(f"Cached Silero model unusable, re-downloading: {e}")
+        
+        model, _ = torch.hub.load(
+            repo_or_dir=SILERO_HUB_REPO,
+            force_reload=cache_dir.exists(),
+            trust_repo=True,
+            **hub_kwargs
+        )
+        return model
+    
     async def synthesize(self, text: str, voice: str = "en_v6") -> Optional[np.ndarray]:
         """Synthesize speech from text."""
         if not self.initialized:
@@ -86,9 +170,9 @@ class SileroTTS:
         try:
             with log_performance(logger, "Silero TTS synthesis"):
                 # Run synthesis in thread pool
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 audio = await loop.run_in_executor(
-                    None,
+                    _TTS_EXECUTOR,
                     self._synthesize_sync,
                     text,
                     voice
@@ -104,15 +188,16 @@ class SileroTTS:
         """Synchronous synthesis."""
         try:
             # Apply model
-            audio = self.model.apply_tts(
-                text=text,
-                speaker=voice,
-                sample_rate=self.sample_rate
-            )
+            with torch.inference_mode(), torch.autocast(device_type='cuda', dtype=torch.float16, enabled=self._amp):
+                audio = self.model.apply_tts(
+                    text=text,
+                    speaker=voice,
+                    sample_rate=self.sample_rate
+                )
             
             # Convert to numpy array
             if isinstance(audio, torch.Tensor):
-                audio = audio.cpu().numpy()
+                audio = audio.float().cpu().numpy()
             
             return audio
             
@@ -124,6 +209,13 @@ class SileroTTS:
 class BarkTTS:
     """Bark TTS implementation."""
     
+    normalized_output = True  # Peak-normalized in _synthesize_sync
+    
+    # Bark generates ~13 s of audio per call and is slow per token, so feed it
+    # roughly one sentence at a time: first audio arrives sooner and long
+    # chunks are not cut off
+    max_chunk_chars = 120
+    
     def __init__(self):
         self.initialized = False
         self.sample_rate = 24000
@@ -136,8 +228,8 @@ class BarkTTS:
                 return False
             
             # Preload models in thread pool
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, preload_models)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(_TTS_EXECUTOR, preload_models)
             
             logger.info("Bark TTS initialized")
             self.initialized = True
@@ -155,9 +247,9 @@ class BarkTTS:
         try:
             with log_performance(logger, "Bark TTS synthesis"):
                 # Run synthesis in thread pool
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 audio = await loop.run_in_executor(
-                    None,
+                    _TTS_EXECUTOR,
                     self._synthesize_sync,
                     text,
                     voice
@@ -175,8 +267,10 @@ class BarkTTS:
             # Generate audio
             audio_array = generate_audio(text, history_prompt=voice)
             
-            # Normalize audio
-            audio_array = audio_array / np.max(np.abs(audio_array))
+            # Normalize audio in place (the array is freshly generated)
+            peak = _peak_amplitude(audio_array)
+            if peak > 0.0:
+                audio_array *= 1.0 / peak
             
             return audio_array
             
@@ -188,10 +282,29 @@ class BarkTTS:
 class Pyttsx3TTS:
     """pyttsx3 TTS implementation."""
     
+    RATE = 200  # Words per minute
+    VOLUME = 0.9
+    normalized_output = True  # 16-bit PCM scaled into [-1, 1)
+    
     def __init__(self):
         self.engine = None
         self.initialized = False
-        self.temp_files = []
+        self.sample_rate = 22050  # Updated from each synthesized file
+        
+        # One scratch file, overwritten per utterance; removed on cleanup/exit
+        self._tmpdir = tempfile.TemporaryDirectory(prefix='jarvis-tts-')
+        self._tmp_path = os.path.join(self._tmpdir.name, 'out.wav')
+        
+        # The pyttsx3 engine lives on one dedicated thread; its drivers
+        # (SAPI/COM, NSSS, espeak) are not safe to use across threads
+        self._commands = queue.Queue()
+        self._worker = None
+        
+        # On Linux, pyttsx3 drives espeak; calling espeak-ng directly streams
+        # the WAV over a pipe instead of round-tripping through a temp file
+        self._espeak = shutil.which('espeak-ng') if sys.platform.startswith('linux') else None
+        # Voice picked in _init_engine; pyttsx3's espeak driver uses espeak voice names as ids
+        self._voice_id = None
     
     async def initialize(self) -> bool:
         """Initialize pyttsx3 TTS."""
@@ -200,9 +313,16 @@ class Pyttsx3TTS:
                 logger.error("pyttsx3 TTS dependencies not available")
                 return False
             
-            # Initialize engine in thread pool
-            loop = asyncio.get_event_loop()
-            success = await loop.run_in_executor(None, self._init_engine)
+            # Initialize engine on its worker thread
+            ready = Future()
+            self._worker = threading.Thread(
+                target=self._engine_loop,
+                args=(ready,),
+                name="pyttsx3-engine",
+                daemon=True
+            )
+            self._worker.start()
+            success = await asyncio.wrap_future(ready)
             
             if success:
                 logger.info("pyttsx3 TTS initialized")
@@ -215,6 +335,31 @@ class Pyttsx3TTS:
             logger.error(f"Failed to initialize pyttsx3 TTS: {e}")
             return False
     
+    def _engine_loop(self, ready: Future) -> None:
+        """Own the pyttsx3 engine and run queued commands against it."""
+        ready.set_result(self._init_engine())
+        if self.engine is None:
+            return
+        
+        while True:
+            command = self._commands.get()
+            if command is None:
+                break
+            
+            func, args, future = command
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args))
+            except Exception as e:
+                future.set_exception(e)
+    
+    def _run_on_engine(self, func, *args) -> asyncio.Future:
+        """Schedule func(*args) on the engine thread and return an awaitable."""
+        future = Future()
+        self._commands.put((func, args, future))
+        return asyncio.wrap_future(future)
+    
     def _init_engine(self) -> bool:
         """Initialize pyttsx3 engine synchronously."""
         try:
@@ -227,16 +372,18 @@ class Pyttsx3TTS:
                 for voice in voices:
                     if 'english' in voice.name.lower() or 'en' in voice.id.lower():
                         self.engine.setProperty('voice', voice.id)
+                        self._voice_id = voice.id
                         break
             
             # Set speech rate and volume
-            self.engine.setProperty('rate', 200)  # Speed
-            self.engine.setProperty('volume', 0.9)  # Volume
+            self.engine.setProperty('rate', self.RATE)  # Speed
+            self.engine.setProperty('volume', self.VOLUME)  # Volume
             
             return True
             
         except Exception as e:
             logger.error(f"Error initializing pyttsx3 engine: {e}")
+            self.engine = None
             return False
     
     async def synthesize(self, text: str, voice: str = None) -> Optional[np.ndarray]:
@@ -247,50 +394,102 @@ class Pyttsx3TTS:
         try:
             with log_performance(logger, "pyttsx3 TTS synthesis"):
                 # Run synthesis in thread pool
-                loop = asyncio.get_event_loop()
-                audio_file = await loop.run_in_executor(
-                    None,
-                    self._synthesize_to_file,
-                    text
-                )
+                loop = asyncio.get_running_loop()
                 
-                if audio_file:
-                    # Load audio file
-                    audio = await self._load_audio_file(audio_file)
-                    return audio
+                if self._espeak:
+                    audio = await loop.run_in_executor(_TTS_EXECUTOR, self._synthesize_in_memory, text)
+                    if audio is not None:
+                        return audio
                 
-                return None
+                # Write and read back on the engine thread so the scratch file
+                # can't be overwritten by the next utterance in between
+                return await self._run_on_engine(self._synthesize_via_file, text)
                 
         except Exception as e:
             logger.error(f"Error in pyttsx3 TTS synthesis: {e}")
             return None
     
-    def _synthesize_to_file(self, text: str) -> Optional[str]:
-        """Synthesize speech to temporary file."""
+    def _synthesize_in_memory(self, text: str) -> Optional[np.ndarray]:
+        """Synthesize speech with espeak-ng, reading the WAV from stdout."""
         try:
-            # Create temporary file
-            temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-            temp_file.close()
+            command = [self._espeak, '--stdout', '-s', str(self.RATE), '-a', str(int(self.VOLUME * 100))]
+            if self._voice_id:
+                command += ['-v', self._voice_id]
+            result = subprocess.run(
+                command + ['--', text],
+                capture_output=True,
+                timeout=config.output.response_timeout
+            )
             
-            # Save to file
-            self.engine.save_to_file(text, temp_file.name)
-            self.engine.runAndWait()
+            pcm = self._parse_wav(result.stdout) if result.returncode == 0 else None
+            if pcm is None:
+                logger.warning("espeak-ng produced no usable audio, falling back to pyttsx3")
+                return None
             
-            self.temp_files.append(temp_file.name)
-            return temp_file.name
+            return np.multiply(np.frombuffer(pcm, dtype='<i2'), np.float32(1.0 / 32768.0))
+            
+        except Exception as e:
+            logger.warning(f"espeak-ng synthesis failed, falling back to pyttsx3: {e}")
+            return None
+    
+    def _parse_wav(self, data: bytes) -> Optional[memoryview]:
+        """Return the 16-bit mono PCM payload of a WAV stream, recording its sample rate."""
+        if data[:4] != b'RIFF' or data[8:12] != b'WAVE':
+            return None
+        
+        # Walk the chunks; streamed output has placeholder sizes, so the
+        # data chunk is taken to run to the end of the stream
+        view = memoryview(data)
+        pos = 12
+        fmt_ok = False
+        while pos + 8 <= len(data):
+            chunk_id = data[pos:pos + 4]
+            size = int.from_bytes(data[pos + 4:pos + 8], 'little')
+            body = pos + 8
+            
+            if chunk_id == b'fmt ':
+                audio_format = int.from_bytes(data[body:body + 2], 'little')
+                channels = int.from_bytes(data[body + 2:body + 4], 'little')
+                bits = int.from_bytes(data[body + 14:body + 16], 'little')
+                if audio_format != 1 or channels != 1 or bits != 16:
+                    return None
+                self.sample_rate = int.from_bytes(data[body + 4:body + 8], 'little')
+                fmt_ok = True
+            elif chunk_id == b'data':
+                if not fmt_ok:
+                    return None
+                end = body + (len(data) - body) // 2 * 2
+                return view[body:end]
+            
+            pos = body + size + (size & 1)
+        
+        return None
+    
+    def _synthesize_via_file(self, text: str) -> Optional[np.ndarray]:
+        """Synthesize speech to the scratch file and load it."""
+        try:
+            self.engine.save_to_file(text, self._tmp_path)
+            self.engine.runAndWait()
             
         except Exception as e:
             logger.error(f"Error synthesizing to file: {e}")
             return None
+        
+        return self._load_audio_file(self._tmp_path)
     
-    async def _load_audio_file(self, file_path: str) -> Optional[np.ndarray]:
-        """Load audio from file."""
+    def _load_audio_file(self, file_path: str) -> Optional[np.ndarray]:
+        """Load audio from file as float32, recording its sample rate."""
         try:
+            if SOUNDFILE_AVAILABLE:
+                # libsndfile decodes straight to float32 in one pass
+                audio, self.sample_rate = sf.read(file_path, dtype='float32', always_2d=False)
+                return audio
+            
             import wave
             
             with wave.open(file_path, 'rb') as wav_file:
                 frames = wav_file.readframes(-1)
-                sample_rate = wav_file.getframerate()
+                self.sample_rate = wav_file.getframerate()
                 
                 # Convert to numpy array
                 audio = np.frombuffer(frames, dtype=np.int16)
@@ -305,26 +504,34 @@ class Pyttsx3TTS:
             return None
     
     def cleanup(self) -> None:
-        """Cleanup temporary files."""
-        for temp_file in self.temp_files:
-            try:
-                Path(temp_file).unlink(missing_ok=True)
-            except:
-                pass
-        self.temp_files.clear()
+        """Stop the engine thread and remove the scratch directory."""
+        if self._worker is not None:
+            self._commands.put(None)
+            self._worker.join(timeout=config.output.response_timeout)
+            self._worker = None
+        
+        self._tmpdir.cleanup()
 
 
 class AudioPlayer:
-    """Audio playback manager."""
+    """Audio playback manager backed by a persistent output stream."""
     
     def __init__(self):
-        self.current_stream = None
         self.playing = False
-        self.play_queue = queue.Queue()
-        self.stop_event = threading.Event()
+        
+        # Long-lived PortAudio stream, reopened only when the sample rate changes
+        self._stream = None
+        self._stream_sr = None
+        
+        # Pending audio chunks consumed by the stream callback; _pos is the
+        # read offset into the head chunk so it is never re-sliced
+        self._ring = deque()
+        self._pos = 0
+        self._lock = threading.Lock()
+        self._idle_waiters = []
     
     async def play_audio(self, audio_data: np.ndarray, sample_rate: int = 22050) -> None:
-        """Play audio data."""
+        """Play audio data and wait until it has finished."""
         try:
             if audio_data is None or len(audio_data) == 0:
                 return
@@ -332,52 +539,245 @@ class AudioPlayer:
             # Stop any current playback
             await self.stop_playback()
             
-            # Play audio in thread pool
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                self._play_audio_sync,
-                audio_data,
-                sample_rate
-            )
+            self.enqueue(audio_data, sample_rate)
+            await self.wait_until_idle()
             
         except Exception as e:
             logger.error(f"Error playing audio: {e}")
     
-    def _play_audio_sync(self, audio_data: np.ndarray, sample_rate: int) -> None:
-        """Play audio synchronously."""
-        try:
+    def enqueue(self, audio_data: np.ndarray, sample_rate: int, normalized: bool = False) -> None:
+        """Queue audio on the output stream without blocking.
+        
+        Pass normalized=True when the producer guarantees samples in [-1, 1]
+        to skip the peak scan.
+        """
+        # Ensure audio is in correct format
+        if audio_data.ndim > 1:
+            audio_data = audio_data.mean(axis=1)
+        audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
+        
+        # Normalize if needed (scaled copy, the caller's buffer may be cached)
+        if not normalized:
+            peak = _peak_amplitude(audio_data)
+            if peak > 1.0:
+                audio_data = audio_data * np.float32(1.0 / peak)
+        
+        self._ensure_stream(sample_rate)
+        
+        with self._lock:
+            self._ring.append(audio_data)
             self.playing = True
+        
+        # Restart after an abort from stop_playback
+        if not self._stream.active:
+            self._stream.start()
+    
+    def _ensure_stream(self, sample_rate: int) -> None:
+        """Open the output stream, or reopen it for a new sample rate."""
+        if self._stream is not None and self._stream_sr == sample_rate:
+            return
+        
+        # Audio queued at the old rate would play at the wrong pitch and speed
+        self.stop_playback_sync()
+        self.close()
+        self._stream = sd.OutputStream(
+            samplerate=sample_rate,
+            channels=1,
+            dtype='float32',
+            callback=self._stream_callback
+        )
+        self._stream.start()
+        self._stream_sr = sample_rate
+    
+    def _stream_callback(self, outdata, frames, time_info, status) -> None:
+        """Fill the device buffer from the queued audio (PortAudio thread)."""
+        written = 0
+        
+        with self._lock:
+            while written < frames and self._ring:
+                head = self._ring[0]
+                n = min(frames - written, len(head) - self._pos)
+                np.copyto(outdata[written:written + n, 0], head[self._pos:self._pos + n])
+                written += n
+                self._pos += n
+                
+                if self._pos >= len(head):
+                    self._ring.popleft()
+                    self._pos = 0
             
-            # Ensure audio is in correct format
-            if audio_data.dtype != np.float32:
-                audio_data = audio_data.astype(np.float32)
-            
-            # Normalize if needed
-            if np.max(np.abs(audio_data)) > 1.0:
-                audio_data = audio_data / np.max(np.abs(audio_data))
-            
-            # Play audio
-            sd.play(audio_data, samplerate=sample_rate)
-            sd.wait()  # Wait until playback is finished
+            if written < frames:
+                outdata[written:] = 0
             
-        except Exception as e:
-            logger.error(f"Error in synchronous audio playback: {e}")
-        finally:
-            self.playing = False
+            if self.playing and not self._ring:
+                self.playing = False
+                self._notify_idle()
+    
+    def _notify_idle(self) -> None:
+        """Wake coroutines waiting for playback to finish (lock must be held)."""
+        for loop, future in self._idle_waiters:
+            loop.call_soon_threadsafe(self._resolve_waiter, future)
+        self._idle_waiters.clear()
+    
+    @staticmethod
+    def _resolve_waiter(future: asyncio.Future) -> None:
+        """Resolve a playback waiter unless it was already cancelled."""
+        if not future.done():
+            future.set_result(None)
+    
+    async def wait_until_idle(self) -> None:
+        """Wait until all queued audio has been played."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        with self._lock:
+            if not self.playing:
+                return
+            self._idle_waiters.append((loop, future))
+        
+        await future
     
     async def stop_playback(self) -> None:
         """Stop current audio playback."""
+        self.stop_playback_sync()
+    
+    def stop_playback_sync(self) -> None:
+        """Stop current audio playback without needing an event loop."""
         try:
-            if self.playing:
-                sd.stop()
-                self.playing = False
+            with self._lock:
+                self._ring.clear()
+                self._pos = 0
+                was_playing = self.playing
+                if was_playing:
+                    self.playing = False
+                    self._notify_idle()
+            
+            # Drop audio already handed to the device without closing the stream
+            # (outside the lock: abort waits for the callback to return)
+            if was_playing and self._stream is not None:
+                self._stream.abort(ignore_errors=True)
         except Exception as e:
             logger.error(f"Error stopping playback: {e}")
     
     def is_playing(self) -> bool:
         """Check if audio is currently playing."""
         return self.playing
+    
+    def close(self) -> None:
+        """Close the output stream."""
+        if self._stream is None:
+            return
+        
+        try:
+            self._stream.close(ignore_errors=True)
+        except Exception as e:
+            logger.error(f"Error closing audio stream: {e}")
+        finally:
+            self._stream = None
+            self._stream_sr = None
+
+
+class TTSCache:
+    """Disk-backed cache of synthesized audio with an in-memory LRU front."""
+    
+    def __init__(self, cache_dir: Path = TTS_CACHE_DIR, max_size_mb: int = 64,
+                 memory_items: int = TTS_CACHE_MEMORY_ITEMS):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.memory_items = memory_items
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            logger.error(f"Error creating TTS cache directory: {e}")
+    
+    @staticmethod
+    def make_key(text: str, voice: str, engine: str) -> str:
+        """Build the content-addressed key for an utterance."""
+        return hashlib.blake2b(f"{text}|{voice}|{engine}".encode("utf-8"), digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[Tuple[np.ndarray, int]]:
+        """Return cached (audio, sample_rate) for key, or None on a miss."""
+        entry = self.get_memory(key)
+        if entry is not None:
+            return entry
+        return self.load(key)
+    
+    def get_memory(self, key: str) -> Optional[Tuple[np.ndarray, int]]:
+        """Look key up in the in-memory LRU only (never touches disk)."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+            return entry
+    
+    def load(self, key: str) -> Optional[Tuple[np.ndarray, int]]:
+        """Read an entry from disk into the in-memory LRU (blocking)."""
+        path = self.cache_dir / f"{key}.npz"
+        try:
+            with np.load(path) as data:
+                entry = (data["audio"], int(data["sample_rate"]))
+            os.utime(path)  # Bump mtime for LRU eviction
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable TTS cache entry {key}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        
+        self._remember(key, entry)
+        return entry
+    
+    def put(self, key: str, audio: np.ndarray, sample_rate: int) -> None:
+        """Store synthesized audio in memory and on disk."""
+        entry = (audio, sample_rate)
+        self._remember(key, entry)
+        
+        try:
+            path = self.cache_dir / f"{key}.npz"
+            tmp_path = path.with_suffix(".tmp.npz")
+            np.savez(tmp_path, audio=audio, sample_rate=sample_rate)
+            os.replace(tmp_path, path)
+            self._evict()
+        except Exception as e:
+            logger.error(f"Error writing TTS cache entry: {e}")
+    
+    def _remember(self, key: str, entry: Tuple[np.ndarray, int]) -> None:
+        """Insert into the in-memory LRU."""
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+    
+    def _evict(self) -> None:
+        """Delete least recently used files while the cache is over its size limit."""
+        entries = []
+        total_size = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(".npz"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total_size += stat.st_size
+        
+        if total_size <= self.max_size_bytes:
+            return
+        
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self.max_size_bytes:
+                break
+            try:
+                os.remove(path)
+                total_size -= size
+            except OSError:
+                pass
+
+
+# Marks the end of an utterance on the synthesis queue
+_END_OF_SPEECH = object()
 
 
 class TTSEngine:
@@ -398,41 +798,50 @@ class TTSEngine:
         # Current engine
         self.current_engine = None
         self.initialized = False
+        self._init_task = None
+        self._warmup_task = None
+        
+        # Incremented per utterance so stale chunks are dropped on interrupt
+        self._speech_id = 0
+        
+        # Synthesized audio for repeated phrases
+        self.cache = TTSCache(max_size_mb=config.voice.tts_cache_mb) if config.voice.tts_cache_mb > 0 else None
     
     async def initialize(self) -> bool:
-        """Initialize TTS engine."""
+        """Initialize TTS engine, warming the pyttsx3 fallback concurrently."""
         try:
             logger.info(f"Initializing TTS engine: {self.engine_type}")
             
-            if self.engine_type == "silero" and SILERO_AVAILABLE:
-                self.silero_tts = SileroTTS()
-                if await self.silero_tts.initialize():
-                    self.current_engine = self.silero_tts
-                    self.initialized = True
-                    return True
-            
-            elif self.engine_type == "bark" and BARK_AVAILABLE:
-                self.bark_tts = BarkTTS()
-                if await self.bark_tts.initialize():
-                    self.current_engine = self.bark_tts
-                    self.initialized = True
-                    return True
-            
-            elif self.engine_type == "pyttsx3" and PYTTSX3_AVAILABLE:
+            primary = self._create_primary_engine()
+            fallback = None
+            if not isinstance(primary, Pyttsx3TTS) and PYTTSX3_AVAILABLE:
                 self.pyttsx3_tts = Pyttsx3TTS()
-                if await self.pyttsx3_tts.initialize():
-                    self.current_engine = self.pyttsx3_tts
-                    self.initialized = True
-                    return True
+                fallback = self.pyttsx3_tts
             
-            # Fallback to pyttsx3 if primary engine fails
-            if not self.initialized and PYTTSX3_AVAILABLE:
+            # Start both so a failover costs no extra wall time
+            primary_task = asyncio.create_task(primary.initialize()) if primary else None
+            fallback_task = asyncio.create_task(fallback.initialize()) if fallback else None
+            
+            if primary_task and await primary_task:
+                self.current_engine = primary
+            elif fallback_task:
                 logger.warning(f"Primary TTS engine '{self.engine_type}' failed, falling back to pyttsx3")
-                self.pyttsx3_tts = Pyttsx3TTS()
-                if await self.pyttsx3_tts.initialize():
-                    self.current_engine = self.pyttsx3_tts
-                    self.initialized = True
-                    return True
+                if await fallback_task:
+                    self.current_engine = fallback
+            
+            # There is no runtime failover, so an unused fallback only holds its
+            # engine thread and scratch directory; let it finish starting, then release it
+            if fallback and self.current_engine is not fallback:
+                await fallback_task
+                self.pyttsx3_tts = None
+                await asyncio.get_running_loop().run_in_executor(_TTS_EXECUTOR, fallback.cleanup)
+            
+            if self.current_engine:
+                self.initialized = True
+                
+                # First-use costs are paid in the background, not on the first reply
+                self._warmup_task = asyncio.create_task(self._warm_up())
+                return True
             
             logger.error("No TTS engine could be initialized")
             return False
@@ -441,8 +850,30 @@ class TTSEngine:
             logger.error(f"Failed to initialize TTS engine: {e}")
             return False
     
+    def _create_primary_engine(self):
+        """Create the configured TTS backend, or None if it is unavailable."""
+        if self.engine_type == "silero" and SILERO_AVAILABLE:
+            self.silero_tts = SileroTTS()
+            return self.silero_tts
+        elif self.engine_type == "bark" and BARK_AVAILABLE:
+            self.bark_tts = BarkTTS()
+            return self.bark_tts
+        elif self.engine_type == "pyttsx3" and PYTTSX3_AVAILABLE:
+            self.pyttsx3_tts = Pyttsx3TTS()
+            return self.pyttsx3_tts
+        return None
+    
+    def start_initialization(self) -> asyncio.Task:
+        """Start initializing in the background (idempotent)."""
+        if self._init_task is None:
+            self._init_task = asyncio.create_task(self.initialize())
+        return self._init_task
+    
     async def speak(self, text: str, interrupt: bool = True) -> bool:
         """Speak the given text."""
+        if not self.initialized:
+            await self.start_initialization()
+        
         if not self.initialized or not self.current_engine:
             logger.warning("TTS engine not initialized")
             return False
@@ -464,49 +895,146 @@ class TTSEngine:
             
             logger.debug(f"Speaking: {text[:100]}...")
             
-            # Synthesize speech
-            audio_data = await self.current_engine.synthesize(text, self.voice)
+            self._speech_id += 1
+            speech_id = self._speech_id
             
-            if audio_data is not None:
-                # Determine sample rate based on engine
-                sample_rate = self._get_sample_rate()
-                
-                # Play audio
-                await self.audio_player.play_audio(audio_data, sample_rate)
-                
-                logger.debug("Speech playback completed")
-                return True
-            else:
+            # Synthesize chunk N+1 while chunk N is playing
+            pending = asyncio.Queue(maxsize=2)
+            producer = asyncio.create_task(self._synthesize_chunks(self._split_chunks(text), pending, speech_id))
+            
+            normalized = getattr(self.current_engine, 'normalized_output', False)
+            spoken = False
+            try:
+                while True:
+                    item = await pending.get()
+                    if item is _END_OF_SPEECH or speech_id != self._speech_id:
+                        break
+                    audio_data, sample_rate = item
+                    self.audio_player.enqueue(audio_data, sample_rate, normalized)
+                    spoken = True
+            finally:
+                # Stop synthesizing chunks nobody will play; the producer may be blocked on the queue
+                if not producer.done():
+                    producer.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await producer
+            
+            if speech_id != self._speech_id:
+                return False  # Superseded by a newer utterance
+            
+            if not spoken:
                 logger.error("Failed to synthesize speech")
                 return False
+            
+            await self.audio_player.wait_until_idle()
+            if speech_id != self._speech_id:
+                return False
+            logger.debug("Speech playback completed")
+            return True
                 
         except Exception as e:
             logger.error(f"Error in speech synthesis: {e}")
             return False
     
+    async def _synthesize_chunks(self, chunks: list, pending: asyncio.Queue, speech_id: int) -> None:
+        """Synthesize text chunks in order, feeding the playback queue."""
+        try:
+            for chunk in chunks:
+                if speech_id != self._speech_id:
+                    break  # Superseded; leave the executor to the newer utterance
+                item = await self._synthesize_cached(chunk)
+                if item is not None:
+                    await pending.put(item)
+        except asyncio.CancelledError:
+            # The consumer stopped reading; waiting to hand it the end marker would hang
+            raise
+        except Exception as e:
+            logger.error(f"Error synthesizing speech chunk: {e}")
+        await pending.put(_END_OF_SPEECH)
+    
+    async def _synthesize_cached(self, chunk: str) -> Optional[Tuple[np.ndarray, int]]:
+        """Return (audio, sample_rate) for a chunk, using the phrase cache."""
+        key = None
+        if self.cache:
+            key = TTSCache.make_key(chunk, self.voice, type(self.current_engine).__name__)
+            cached = self.cache.get_memory(key)
+            if cached is None:
+                # Disk reads stay off the event loop, like cache writes
+                loop = asyncio.get_running_loop()
+                cached = await loop.run_in_executor(_TTS_EXECUTOR, self.cache.load, key)
+            if cached is not None:
+                return cached
+        
+        audio_data = await self.current_engine.synthesize(chunk, self.voice)
+        if audio_data is None or len(audio_data) == 0:
+            return None
+        
+        sample_rate = self._get_sample_rate()
+        if key:
+            asyncio.get_running_loop().run_in_executor(_TTS_EXECUTOR, self.cache.put, key, audio_data, sample_rate)
+        return audio_data, sample_rate
+    
+    async def _warm_up(self) -> None:
+        """Prime the engine and pre-synthesize common phrases into the cache."""
+        try:
+            # Silero runs its own warmup during initialize
+            if not isinstance(self.current_engine, SileroTTS):
+                await self.current_engine.synthesize("ready", self.voice)
+            
+            if self.cache:
+                for phrase in config.voice.precache_phrases:
+                    for chunk in self._split_chunks(self._clean_text(phrase)):
+                        await self._synthesize_cached(chunk)
+        except Exception as e:
+            logger.warning(f"TTS warmup failed: {e}")
+    
+    def _split_chunks(self, text: str) -> list:
+        """Split text into sentence chunks sized for the current engine."""
+        max_chars = getattr(self.current_engine, 'max_chunk_chars', MAX_CHUNK_CHARS)
+        chunks = []
+        current = ""
+        
+        for sentence in SENTENCE_SPLIT_RE.split(text):
+            # Break up sentences that are too long on their own
+            while len(sentence) > max_chars:
+                cut = sentence.rfind(" ", 0, max_chars)
+                if cut <= 0:
+                    cut = max_chars
+                if current:
+                    chunks.append(current)
+                    current = ""
+                chunks.append(sentence[:cut])
+                sentence = sentence[cut:].lstrip()
+            
+            # Merge short sentences into a single chunk
+            if current and len(current) + 1 + len(sentence) <= max_chars:
+                current = f"{current} {sentence}"
+            else:
+                if current:
+                    chunks.append(current)
+                current = sentence
+        
+        if current:
+            chunks.append(current)
+        
+        return chunks
+    
     def _clean_text(self, text: str) -> str:
         """Clean text for TTS."""
         if not text:
             return ""
         
-        # Remove excessive whitespace
-        text = " ".join(text.split())
-        
-        # Limit length
+        # Limit length first so oversized input isn't scanned in full
         max_length = 1000  # Reasonable limit for TTS
         if len(text) > max_length:
             text = text[:max_length] + "..."
         
-        return text.strip()
+        # Collapse whitespace in a single pass
+        return WHITESPACE_RE.sub(" ", text).strip()
     
     def _get_sample_rate(self) -> int:
         """Get sample rate for current engine."""
-        if isinstance(self.current_engine, SileroTTS):
-            return self.current_engine.sample_rate
-        elif isinstance(self.current_engine, BarkTTS):
-            return self.current_engine.sample_rate
-        else:
-            return 22050  # Default sample rate
+        return getattr(self.current_engine, 'sample_rate', 22050)
     
     async def stop_speaking(self) -> None:
         """Stop current speech."""
@@ -558,10 +1086,8 @@ class TTSEngine:
         logger.info("Cleaning up TTS engine...")
         
         # Stop any playback
-        try:
-            asyncio.create_task(self.audio_player.stop_playback())
-        except:
-            pass
+        self.audio_player.stop_playback_sync()
+        self.audio_player.close()
         
         # Cleanup engines
         if self.pyttsx3_tts:
@@ -4,20 +4,17 @@ Handles chat window with proper threading and message display.
 """
 
 import asyncio
+import importlib.util
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, Callable
-import tkinter as tk
-from tkinter import ttk, scrolledtext
-import queue
 import time
-from datetime import datetime
+from collections import deque
+from functools import lru_cache, wraps
 from pathlib import Path
 
-try:
-    from plyer import notification
-    PLYER_AVAILABLE = True
-except ImportError:
-    PLYER_AVAILABLE = False
+# plyer is only imported when the first notification is sent
+PLYER_AVAILABLE = importlib.util.find_spec("plyer") is not None
 
 from ..core.config import config
 from ..core.logging import get_logger
@@ -25,18 +22,119 @@ from ..core.logging import get_logger
 logger = get_logger("ui_manager")
 
 
+def _log_notification(title: str = "", message: str = "", **kwargs) -> None:
+    """Fallback notifier used when plyer is not installed."""
+    logger.info(f"Notification: {title} - {message}")
+
+
+# Bound on first use so notification call sites need no availability check
+_send_notification = None
+
+
+def _get_notifier() -> Callable:
+    """Return the notification backend, importing plyer on first use."""
+    global _send_notification
+    if _send_notification is None:
+        try:
+            from plyer import notification
+            _send_notification = notification.notify
+        except ImportError:
+            _send_notification = _log_notification
+    return _send_notification
+
+
+# Tk is imported on first window creation so headless sessions never load it
+tk = None
+ttk = None
+scrolledtext = None
+_tkinter = None
+
+
+def _import_tk() -> None:
+    """Import tkinter modules on first use."""
+    global tk, ttk, scrolledtext, _tkinter
+    if tk is None:
+        import _tkinter as tkinter_core
+        import tkinter
+        from tkinter import ttk as tkinter_ttk, scrolledtext as tkinter_scrolledtext
+        _tkinter = tkinter_core
+        ttk = tkinter_ttk
+        scrolledtext = tkinter_scrolledtext
+        tk = tkinter
+
+
+@lru_cache(maxsize=16)
+def _sender_style(sender: str) -> tuple:
+    """Return the display tag and line template for a message sender."""
+    if sender == "System":
+        return "system", "[%s] %s\n"
+    if sender == "You":
+        return "user", "[%s] You: %s\n"
+    return "assistant", "[%s] " + sender.replace("%", "%%") + ": %s\n"
+
+
+# Last formatted second, reused while messages arrive within the same second
+_last_sec = [None, ""]
+
+
+def _fmt_time(ts: float) -> str:
+    """Format an epoch timestamp as HH:MM:SS, reusing the previous result within the same second."""
+    sec = int(ts)
+    if sec != _last_sec[0]:
+        _last_sec[0] = sec
+        _last_sec[1] = time.strftime("%H:%M:%S", time.localtime(sec))
+    return _last_sec[1]
+
+
+def _guard(fn: Callable) -> Callable:
+    """Log and swallow exceptions from UI handlers that must never propagate."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"{fn.__name__} failed: {e}")
+    return wrapper
+
+
+# Keys that may still act on the read-only chat display
+_NAVIGATION_KEYS = frozenset({"Up", "Down", "Left", "Right", "Prior", "Next", "Home", "End"})
+
+
 class ChatWindow:
     """Simple, reliable chat interface window."""
     
+    # Queued messages are flushed at most once per frame (~60 Hz)
+    FRAME_MS = 16
+    # Messages restored per scroll-back step once the top of the view is reached
+    HISTORY_CHUNK = 50
+    # Bound on scroll-back history retained in memory
+    HISTORY_LIMIT = 2000
+    
     def __init__(self):
         self.root = None
         self.chat_display = None
         self.input_entry = None
         self.send_callback = None
+        self.send_executor = None
+        self.status_label = None
+        self.threaded_send = True
+        self._cb_is_coro = False
         self.is_open = False
-        self.message_queue = queue.Queue()
+        self._msgs = deque()
+        self._pending = False
+        self._last_msg = (None, None)
+        self._pump_id = None
+        self._flush_id = None
+        self.max_lines = config.ui.max_chat_lines or 2000
+        self._visible = deque()
+        self._visible_lines = 0
+        self._history = deque(maxlen=self.HISTORY_LIMIT)
+        self.tick_ms = 5
     
-    def create_window(self, send_callback: Optional[Callable] = None) -> None:
+    def create_window(self, send_callback: Optional[Callable] = None,
+                      executor: Optional[ThreadPoolExecutor] = None,
+                      threaded: bool = True) -> None:
         """Create chat window in main thread."""
         try:
             if self.is_open and self.root:
@@ -44,7 +142,15 @@ class ChatWindow:
                 self.root.focus_force()
                 return
             
+            _import_tk()
+            
             self.send_callback = send_callback
+            # Non-threaded callbacks only schedule work and run on the GUI thread
+            self.threaded_send = threaded
+            self._cb_is_coro = asyncio.iscoroutinefunction(send_callback)
+            self.send_executor = executor or self.send_executor or ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="jarvis-chat"
+            )
             
             # Create main window
             self.root = tk.Tk()
@@ -68,13 +174,24 @@ class ChatWindow:
             self.chat_display = scrolledtext.ScrolledText(
                 chat_frame,
                 wrap=tk.WORD,
-                state=tk.DISABLED,
                 font=("Consolas", 10),
                 height=20,
                 bg="white",
                 fg="black"
             )
             self.chat_display.pack(fill=tk.BOTH, expand=True)
+            self.chat_display.config(yscrollcommand=self._on_yscroll)
+            self.chat_display.bind("<<ScrollTop>>", self._rehydrate_history)
+            
+            # Read-only by intercepting edits, so inserts need no NORMAL/DISABLED toggling
+            self.chat_display.bind("<Key>", self._block_edit)
+            for sequence in ("<<Paste>>", "<<Cut>>", "<<Clear>>", "<Button-2>"):
+                self.chat_display.bind(sequence, lambda e: "break")
+            
+            # Configure message tags once so every insert reuses the same styles
+            self.chat_display.tag_configure("system", foreground="#888888")
+            self.chat_display.tag_configure("user", foreground="#1a73e8")
+            self.chat_display.tag_configure("assistant", foreground="#0b8043")
             
             # Input frame
             input_frame = ttk.Frame(main_frame)
@@ -101,16 +218,18 @@ class ChatWindow:
             
             # Bind events
             self.input_entry.bind("<Return>", lambda e: self._on_send())
+            self.root.bind("<<NewMsg>>", self._on_new_message)
             self.root.protocol("WM_DELETE_WINDOW", self._on_close)
             
             # Focus input
             self.input_entry.focus_set()
             
-            # Start message processing
-            self._process_message_queue()
-            
             self.is_open = True
             
+            # Start message processing (only one pump per window)
+            if self._pump_id is None:
+                self._process_message_queue()
+            
             # Add welcome message
             self.add_message("System", "Jarvis AI Assistant ready! Type your message below.")
             
@@ -135,143 +254,306 @@ class ChatWindow:
                 # Update status
                 self.status_label.config(text="Processing...")
                 
-                # Call callback in separate thread to avoid blocking GUI
+                # Pick the cheapest dispatch path for the callback type
                 if self.send_callback:
-                    def send_async():
-                        try:
-                            self.send_callback(text)
-                        except Exception as e:
-                            logger.error(f"Error in send callback: {e}")
-                            self.add_message("System", f"Error: {e}")
-                        finally:
-                            # Reset status (thread-safe)
-                            if self.root and self.is_open:
-                                try:
-                                    self.root.after_idle(lambda: self.status_label.config(text="Ready") if hasattr(self, 'status_label') else None)
-                                except RuntimeError:
-                                    # GUI thread not available, skip status update
-                                    pass
-                    
-                    thread = threading.Thread(target=send_async, daemon=True)
-                    thread.start()
+                    if self._cb_is_coro:
+                        self._send_coroutine(text)
+                    elif self.threaded_send:
+                        self.send_executor.submit(self._call_send_callback, text)
+                    else:
+                        self._call_send_callback(text)
                 
         except Exception as e:
             logger.error(f"Error in send handler: {e}")
             self.add_message("System", f"Send error: {e}")
     
-    def _on_close(self) -> None:
-        """Handle window close."""
+    def _call_send_callback(self, text: str) -> None:
+        """Invoke a synchronous send callback."""
         try:
-            self.is_open = False
-            if self.root:
-                self.root.quit()
-                self.root.destroy()
-                self.root = None
-            logger.info("Chat window closed")
+            self.send_callback(text)
         except Exception as e:
-            logger.error(f"Error closing chat window: {e}")
+            logger.error(f"Error in send callback: {e}")
+            self.add_message("System", f"Error: {e}")
+        finally:
+            self._reset_status()
+    
+    def _send_coroutine(self, text: str) -> None:
+        """Schedule a coroutine send callback without a worker thread."""
+        try:
+            asyncio.get_running_loop()
+            future = asyncio.ensure_future(self.send_callback(text))
+        except RuntimeError:
+            # Tk is not pumped from an event loop, run the coroutine on the executor
+            future = self.send_executor.submit(asyncio.run, self.send_callback(text))
+        future.add_done_callback(self._on_send_done)
+    
+    def _on_send_done(self, future) -> None:
+        """Report errors from a coroutine send callback."""
+        try:
+            e = future.exception()
+        except Exception as cancel_error:
+            e = cancel_error
+        if e is not None:
+            logger.error(f"Error in send callback: {e}")
+            self.add_message("System", f"Error: {e}")
+        self._reset_status()
+    
+    def _reset_status(self) -> None:
+        """Reset the status label (thread-safe)."""
+        self._post(self._set_status, "Ready")
+    
+    def _set_status(self, text: str) -> None:
+        """Set the status label text (GUI thread only)."""
+        if self.status_label:
+            self.status_label.config(text=text)
+    
+    def _post(self, fn: Callable, *args) -> None:
+        """Run fn(*args) on the GUI thread when idle; no-op once the window is closed."""
+        root = self.root
+        if self.is_open and root:
+            try:
+                root.after_idle(fn, *args)
+            except (RuntimeError, tk.TclError):
+                pass
+    
+    @_guard
+    def _on_close(self) -> None:
+        """Handle window close."""
+        self.is_open = False
+        if self.root:
+            if self._pump_id:
+                self.root.after_cancel(self._pump_id)
+                self._pump_id = None
+            if self._flush_id:
+                self.root.after_cancel(self._flush_id)
+                self._flush_id = None
+            self.root.quit()
+            self.root.destroy()
+            self.root = None
+        
+        # Drop references to destroyed widgets and the retained message text
+        self.chat_display = None
+        self.input_entry = None
+        self.status_label = None
+        self._visible.clear()
+        self._visible_lines = 0
+        self._history.clear()
+        logger.info("Chat window closed")
     
+    @_guard
     def add_message(self, sender: str, message: str) -> None:
         """Add message to chat display (thread-safe)."""
-        try:
-            # Queue the message for processing
-            self.message_queue.put({
-                'sender': sender,
-                'message': message,
-                'timestamp': datetime.now()
-            })
-        except Exception as e:
-            logger.error(f"Error queuing message: {e}")
+        # Skip repeated system messages such as echoed errors
+        key = (sender, message)
+        if sender == "System" and key == self._last_msg:
+            return
+        self._last_msg = key
+        
+        # Queue the message for processing (deque appends are thread-safe)
+        self._msgs.append((sender, message, time.time()))
+        
+        # Wake the GUI thread once per burst
+        if not self._pending and self.root and self.is_open:
+            self._pending = True
+            try:
+                self.root.event_generate("<<NewMsg>>", when="tail")
+            except (RuntimeError, tk.TclError):
+                # GUI thread not reachable, fallback poll will pick it up
+                pass
+    
+    @staticmethod
+    def _block_edit(event) -> Optional[str]:
+        """Swallow editing keys while still allowing navigation and copy."""
+        if event.keysym in _NAVIGATION_KEYS:
+            return None
+        if event.state & 0x4 and event.keysym.lower() in ("c", "a"):
+            return None
+        return "break"
+    
+    def _on_new_message(self, event=None) -> None:
+        """Coalesce wake-ups so a burst of messages is drawn in one frame."""
+        if self._flush_id is None and self.root:
+            self._flush_id = self.root.after(self.FRAME_MS, self._flush_pending)
+    
+    def _flush_pending(self) -> None:
+        """Drain messages gathered during the current frame."""
+        self._flush_id = None
+        self._process_message_queue()
     
     def _process_message_queue(self) -> None:
         """Process queued messages (runs in GUI thread)."""
         try:
-            # Process all queued messages
-            while not self.message_queue.empty():
-                try:
-                    msg_data = self.message_queue.get_nowait()
-                    self._add_message_to_display(
-                        msg_data['sender'],
-                        msg_data['message'],
-                        msg_data['timestamp']
-                    )
-                except queue.Empty:
-                    break
-                except Exception as e:
-                    logger.error(f"Error processing message: {e}")
+            # Drain everything pending so a burst renders in one pass
+            self._pending = False
+            batch = []
+            while self._msgs:
+                batch.append(self._msgs.popleft())
+            
+            if batch and self._add_messages_to_display(batch):
+                # Scroll once per drain, and only if the user was following along
+                self.chat_display.see(tk.END)
             
-            # Schedule next check
-            if self.root and self.is_open:
-                self.root.after(100, self._process_message_queue)
-                
         except Exception as e:
             logger.error(f"Error in message queue processing: {e}")
+        finally:
+            self._schedule_pump()
+    
+    def _schedule_pump(self) -> None:
+        """(Re)arm the single safety poll in case a wake-up event was missed."""
+        try:
+            if self.root and self.is_open:
+                if self._pump_id:
+                    self.root.after_cancel(self._pump_id)
+                self._pump_id = self.root.after(500, self._process_message_queue)
+        except Exception as e:
+            self._pump_id = None
+            logger.error(f"Error scheduling message pump: {e}")
     
-    def _add_message_to_display(self, sender: str, message: str, timestamp: datetime) -> None:
+    def _add_message_to_display(self, sender: str, message: str, timestamp: float) -> None:
         """Add message directly to display (must be called from GUI thread)."""
+        if self._add_messages_to_display([(sender, message, timestamp)]):
+            self.chat_display.see(tk.END)
+    
+    def _add_messages_to_display(self, batch: list) -> bool:
+        """Add a batch of messages with a single insert; return True if the view should follow."""
         try:
             if not self.chat_display:
-                return
-            
-            time_str = timestamp.strftime("%H:%M:%S")
-            
-            # Enable editing
-            self.chat_display.config(state=tk.NORMAL)
-            
-            # Add message with formatting
-            if sender == "System":
-                self.chat_display.insert(tk.END, f"[{time_str}] {message}\n", "system")
-            elif sender == "You":
-                self.chat_display.insert(tk.END, f"[{time_str}] You: {message}\n", "user")
-            else:
-                self.chat_display.insert(tk.END, f"[{time_str}] {sender}: {message}\n", "assistant")
+                return False
+            
+            entries = []
+            for sender, message, timestamp in batch:
+                tag, fmt = _sender_style(sender)
+                entries.append((fmt % (_fmt_time(timestamp), message), tag))
+            block, tag_ranges = self._build_block(entries)
+            
+            # Only auto-scroll when the view is already at the bottom
+            at_bottom = self.chat_display.yview()[1] >= 0.99
+            
+            start = self.chat_display.index("end-1c")
+            self.chat_display.insert(tk.END, block)
+            for begin, end, tag in tag_ranges:
+                self.chat_display.tag_add(tag, f"{start}+{begin}c", f"{start}+{end}c")
+            
+            for entry in entries:
+                self._visible.append(entry)
+                self._visible_lines += entry[0].count("\n") + 1
+            
+            # Move the oldest messages into scroll-back history so the widget stays bounded,
+            # but never while the user is reading older content
+            if at_bottom and self._visible_lines > self.max_lines:
+                trimmed = 0
+                while self._visible_lines > self.max_lines and len(self._visible) > 1:
+                    entry = self._visible.popleft()
+                    lines = entry[0].count("\n") + 1
+                    self._visible_lines -= lines
+                    trimmed += lines
+                    self._history.append(entry)
+                self.chat_display.delete("1.0", f"{trimmed + 1}.0")
+            
+            return at_bottom
             
-            self.chat_display.insert(tk.END, "\n")
+        except Exception as e:
+            logger.error(f"Error adding messages to display: {e}")
+            return False
+    
+    @staticmethod
+    def _build_block(entries: list) -> tuple:
+        """Join rendered (line, tag) entries into one string plus per-entry tag ranges."""
+        parts = []
+        tag_ranges = []
+        offset = 0
+        for line, tag in entries:
+            parts.append(line)
+            parts.append("\n")
+            tag_ranges.append((offset, offset + len(line), tag))
+            offset += len(line) + 1
+        return "".join(parts), tag_ranges
+    
+    def _on_yscroll(self, first: str, last: str) -> None:
+        """Update the scrollbar and request older history when the top is reached."""
+        self.chat_display.vbar.set(first, last)
+        if self._history and float(first) <= 0.0 and float(last) < 1.0:
+            self.chat_display.event_generate("<<ScrollTop>>", when="tail")
+    
+    def _rehydrate_history(self, event=None) -> None:
+        """Re-insert the next chunk of scroll-back history above the visible messages."""
+        try:
+            if not self.chat_display or not self._history:
+                return
             
-            # Disable editing
-            self.chat_display.config(state=tk.DISABLED)
+            entries = []
+            while self._history and len(entries) < self.HISTORY_CHUNK:
+                entries.append(self._history.pop())
+            entries.reverse()
+            block, tag_ranges = self._build_block(entries)
             
-            # Scroll to bottom
-            self.chat_display.see(tk.END)
+            self.chat_display.insert("1.0", block)
+            for begin, end, tag in tag_ranges:
+                self.chat_display.tag_add(tag, f"1.0+{begin}c", f"1.0+{end}c")
             
-            # Update display
-            self.chat_display.update_idletasks()
+            # Keep the previously visible first line in place
+            added = 0
+            for entry in reversed(entries):
+                self._visible.appendleft(entry)
+                added += entry[0].count("\n") + 1
+            self._visible_lines += added
+            self.chat_display.yview(f"{added + 1}.0")
             
         except Exception as e:
-            logger.error(f"Error adding message to display: {e}")
+            logger.error(f"Error restoring chat history: {e}")
     
+    @_guard
     def show(self) -> None:
         """Show chat window."""
-        try:
-            if self.root and self.is_open:
-                self.root.deiconify()
-                self.root.lift()
-                self.root.focus_force()
-        except Exception as e:
-            logger.error(f"Error showing chat window: {e}")
+        if self.root and self.is_open:
+            self.root.deiconify()
+            self.root.lift()
+            self.root.focus_force()
     
+    @_guard
     def run_mainloop(self) -> None:
         """Run the GUI main loop."""
-        try:
-            if self.root:
-                self.root.mainloop()
-        except Exception as e:
-            logger.error(f"Error in mainloop: {e}")
+        if self.root:
+            self.root.mainloop()
 
 
 class UIManager:
     """Fixed UI manager with proper threading."""
     
+    # Notifications arriving within this window collapse into the latest one
+    NOTIFY_COALESCE_S = 0.25
+    # Upper bound for the adaptive pump interval while the window sits idle
+    MAX_TICK = 0.1
+    
     def __init__(self):
         self.chat_window = None
         self.message_callback = None
         self.shutdown_callback = None
         self.initialized = False
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="jarvis-ui")
+        self._loop = None
+        self._loop_thread = None
+        self._main_loop = None
+        self._window_shown = None
+        self._tick = 0.005
+        self._notifications_enabled = bool(config.output.show_notifications)
+        self._notify_lock = threading.Lock()
+        self._pending_notification = None
+        self._notify_timer = None
     
     async def initialize(self) -> bool:
         """Initialize UI manager."""
         try:
             logger.info("Initializing UI manager...")
+            
+            self.reload_settings()
+            
+            # Let process_events sleep until a chat window exists instead of polling
+            self._main_loop = asyncio.get_running_loop()
+            self._window_shown = asyncio.Event()
+            if self.chat_window and self.chat_window.is_open:
+                self._window_shown.set()
+            
             self.initialized = True
             logger.info("UI manager initialized successfully")
             return True
@@ -286,39 +568,67 @@ class UIManager:
                 self.chat_window = ChatWindow()
             
             # Create window with callback
-            self.chat_window.create_window(self._on_chat_message)
+            self.chat_window.create_window(self._on_chat_message, self._executor, threaded=False)
+            self._wake_event_pump()
             
             logger.info("Chat window shown")
             
         except Exception as e:
             logger.error(f"Error showing chat window: {e}")
     
+    def _wake_event_pump(self) -> None:
+        """Wake process_events if it is waiting for a chat window."""
+        if self._main_loop and not self._main_loop.is_closed():
+            self._main_loop.call_soon_threadsafe(self._window_shown.set)
+    
     def _on_chat_message(self, message: str) -> None:
         """Handle chat message from user."""
         try:
             logger.info(f"Chat message received: {message}")
             
             if self.message_callback:
-                # Call the callback asynchronously
-                def call_callback():
-                    try:
-                        # Create new event loop for this thread
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        loop.run_until_complete(self.message_callback(message, "text"))
-                        loop.close()
-                    except Exception as e:
-                        logger.error(f"Error in message callback: {e}")
-                        # Show error in chat
-                        if self.chat_window:
-                            self.chat_window.add_message("System", f"Error processing message: {e}")
-                
-                callback_thread = threading.Thread(target=call_callback, daemon=True)
-                callback_thread.start()
+                try:
+                    # Tk is pumped from the assistant's event loop, so schedule there directly
+                    asyncio.get_running_loop()
+                    future = asyncio.ensure_future(self.message_callback(message, "text"))
+                except RuntimeError:
+                    # Called off-loop: hand over to the assistant's loop, or a private one if none
+                    loop = self._main_loop
+                    if loop is None or loop.is_closed():
+                        loop = self._ensure_loop()
+                    future = asyncio.run_coroutine_threadsafe(
+                        self.message_callback(message, "text"), loop
+                    )
+                future.add_done_callback(self._on_callback_done)
             
         except Exception as e:
             logger.error(f"Error handling chat message: {e}")
     
+    def _on_callback_done(self, future) -> None:
+        """Surface errors raised by the message callback."""
+        try:
+            e = future.exception()
+        except Exception as cancel_error:
+            e = cancel_error
+        if e is not None:
+            logger.error(f"Error in message callback: {e}")
+            # Show error in chat
+            if self.chat_window:
+                self.chat_window.add_message("System", f"Error processing message: {e}")
+    
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the fallback event loop used when initialize() was never awaited."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+            
+            def run_loop():
+                asyncio.set_event_loop(self._loop)
+                self._loop.run_forever()
+            
+            self._loop_thread = threading.Thread(target=run_loop, name="jarvis-ui-loop", daemon=True)
+            self._loop_thread.start()
+        return self._loop
+    
     def show_response(self, user_input: str, ai_response: str) -> None:
         """Show conversation in UI."""
         try:
@@ -327,36 +637,76 @@ class UIManager:
             # Add to chat window
             if self.chat_window and self.chat_window.is_open:
                 self.chat_window.add_message("Jarvis", ai_response)
+                self._mark_activity()
             
-            # Show notification for short responses
-            if len(ai_response) < 100 and PLYER_AVAILABLE:
-                try:
-                    notification.notify(
-                        title="Jarvis",
-                        message=ai_response[:100],
-                        timeout=5,
-                        app_name="Jarvis AI Assistant"
-                    )
-                except Exception as e:
-                    logger.error(f"Notification error: {e}")
+            # Show notification for short responses unless the chat is already in view
+            if (self._notifications_enabled and len(ai_response) < 100
+                    and PLYER_AVAILABLE and not self._chat_has_focus()):
+                self._queue_notification("Jarvis", ai_response[:100], 5)
                     
         except Exception as e:
             logger.error(f"Error showing response: {e}")
     
-    def show_notification(self, title: str, message: str, timeout: int = 5) -> None:
-        """Show system notification."""
+    def _chat_has_focus(self) -> bool:
+        """Check whether the chat window currently has keyboard focus."""
         try:
-            if PLYER_AVAILABLE:
-                notification.notify(
-                    title=title,
-                    message=message,
-                    timeout=timeout,
-                    app_name="Jarvis AI Assistant"
-                )
-            else:
-                logger.info(f"Notification: {title} - {message}")
+            return bool(
+                self.chat_window and self.chat_window.root and self.chat_window.is_open
+                and self.chat_window.root.focus_displayof() is not None
+            )
+        except Exception:
+            return False
+    
+    @staticmethod
+    def _notify(title: str, message: str, timeout: int) -> None:
+        """Send a desktop notification."""
+        try:
+            _get_notifier()(
+                title=title,
+                message=message,
+                timeout=timeout,
+                app_name="Jarvis AI Assistant"
+            )
         except Exception as e:
-            logger.error(f"Error showing notification: {e}")
+            logger.error(f"Notification error: {e}")
+    
+    def show_notification(self, title: str, message: str, timeout: int = 5) -> None:
+        """Show system notification."""
+        if self._notifications_enabled:
+            self._queue_notification(title, message, timeout)
+    
+    def _queue_notification(self, title: str, message: str, timeout: int) -> None:
+        """Collect notifications for a short window and only show the latest one."""
+        with self._notify_lock:
+            self._pending_notification = (title, message, timeout)
+            if self._notify_timer is not None:
+                return
+            self._notify_timer = threading.Timer(self.NOTIFY_COALESCE_S, self._flush_notification)
+            self._notify_timer.daemon = True
+            self._notify_timer.start()
+    
+    def _flush_notification(self) -> None:
+        """Send the most recent pending notification (runs on the timer thread)."""
+        with self._notify_lock:
+            pending = self._pending_notification
+            self._pending_notification = None
+            self._notify_timer = None
+        if pending:
+            self._notify(*pending)
+    
+    def reload_settings(self) -> None:
+        """Re-read cached output settings after the configuration changes."""
+        self._notifications_enabled = bool(config.output.show_notifications)
+        if not self._notifications_enabled:
+            self._cancel_notification()
+    
+    def _cancel_notification(self) -> None:
+        """Drop the pending notification and stop its timer."""
+        with self._notify_lock:
+            if self._notify_timer is not None:
+                self._notify_timer.cancel()
+                self._notify_timer = None
+            self._pending_notification = None
     
     def set_message_callback(self, callback: Callable) -> None:
         """Set callback for handling messages."""
@@ -366,12 +716,38 @@ class UIManager:
         """Set callback for shutdown requests."""
         self.shutdown_callback = callback
     
+    @property
+    def tick_interval(self) -> float:
+        """Seconds until the next event pump; short after activity, backing off when idle."""
+        if self.chat_window and self.chat_window.is_open:
+            return self._tick
+        return self.MAX_TICK
+    
+    def _mark_activity(self) -> None:
+        """Reset the pump interval to its minimum after UI activity."""
+        if self.chat_window:
+            self._tick = self.chat_window.tick_ms / 1000
+    
     async def process_events(self) -> None:
         """Process UI events."""
         try:
-            # Update GUI if chat window exists
-            if self.chat_window and self.chat_window.root and self.chat_window.is_open:
-                self.chat_window.root.update()
+            if not (self.chat_window and self.chat_window.root and self.chat_window.is_open):
+                # Nothing to pump; wait for show_chat_window instead of polling
+                if self._window_shown and self.initialized:
+                    self._window_shown.clear()
+                    await self._window_shown.wait()
+                return
+            
+            # Drain pending Tk events without update()'s extra display sync
+            dooneevent = self.chat_window.root.tk.dooneevent
+            handled = 0
+            while dooneevent(_tkinter.ALL_EVENTS | _tkinter.DONT_WAIT):
+                handled += 1
+            
+            if handled:
+                self._mark_activity()
+            else:
+                self._tick = min(self.MAX_TICK, self._tick * 1.5)
         except Exception as e:
             logger.error(f"Error processing UI events: {e}")
     
@@ -383,7 +759,14 @@ class UIManager:
             if self.chat_window:
                 self.chat_window._on_close()
             
+            self._cancel_notification()
+            
+            self._executor.shutdown(wait=False)
             self.initialized = False
+            self._wake_event_pump()
+            if self._loop and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
             logger.info("UI manager cleanup complete")
             
         except Exception as e:
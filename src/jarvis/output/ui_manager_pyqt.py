@@ -4,131 +4,426 @@ Features transparent window, modern styling, and proper threading.
 """
 
 import sys
+import html
+import importlib.util
 import asyncio
 import threading
-from typing import Optional, Callable
+import itertools
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from math import ceil
+from typing import Optional, Callable, Iterable
 from datetime import datetime
 from pathlib import Path
 
 try:
     from PyQt6.QtWidgets import (
         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-        QTextEdit, QLineEdit, QPushButton, QLabel, QScrollArea,
+        QTextEdit, QLineEdit, QPushButton, QLabel, QListView,
+        QAbstractItemView, QStyledItemDelegate, QStyle,
         QFrame, QSizePolicy, QSystemTrayIcon, QMenu
     )
     from PyQt6.QtCore import (
         Qt, QThread, pyqtSignal, QTimer, QPropertyAnimation,
-        QEasingCurve, QRect, QSize
+        QEasingCurve, QPoint, QRect, QRectF, QSize, QAbstractListModel, QModelIndex
     )
     from PyQt6.QtGui import (
-        QFont, QColor, QPalette, QIcon, QPixmap, QPainter,
-        QLinearGradient, QBrush, QTextCursor
+        QFont, QColor, QPalette, QIcon, QPixmap, QPainter, QPen,
+        QLinearGradient, QGradient, QBrush, QTextCursor, QTextDocument, QAction, QKeySequence
     )
     PYQT_AVAILABLE = True
 except ImportError:
     PYQT_AVAILABLE = False
 
+# plyer is imported off the GUI thread by _warm_imports, or on first notification
+PLYER_AVAILABLE = importlib.util.find_spec("plyer") is not None
+
+# Optional Qt-backed asyncio loop: when the assistant runs on it, Qt events need no polling
 try:
-    from plyer import notification
-    PLYER_AVAILABLE = True
+    import qasync
+    QASYNC_AVAILABLE = True
 except ImportError:
-    PLYER_AVAILABLE = False
+    QASYNC_AVAILABLE = False
 
 from ..core.config import config
 from ..core.logging import get_logger
 
 logger = get_logger("ui_manager_pyqt")
 
+# Tray icon is built once on first use (Qt needs a QApplication before creating pixmaps)
+_TRAY_ICON = None
+
+
+def _get_tray_icon():
+    """Return the cached tray icon, building it on first use."""
+    global _TRAY_ICON
+    if _TRAY_ICON is None:
+        pixmap = QPixmap(16, 16)
+        pixmap.fill(QColor(102, 126, 234))  # Blue color
+        _TRAY_ICON = QIcon(pixmap)
+    return _TRAY_ICON
+
+
+_notify = None
+
+
+def _get_notifier() -> Callable:
+    """Return plyer's notify function, importing plyer on first use."""
+    global _notify
+    if _notify is None:
+        from plyer import notification
+        _notify = notification.notify
+    return _notify
+
+
+def _warm_imports():
+    """Import modules that UI handlers need lazily, so the first click does not pay for them."""
+    try:
+        if PLYER_AVAILABLE:
+            _get_notifier()
+        from ..ui import settings_window  # noqa: F401
+    except Exception as e:
+        logger.error(f"Error pre-importing UI modules: {e}")
+
+
+def _log_slot_error(exc_type, exc, tb):
+    """Log exceptions escaping Qt slots; PyQt6 would otherwise abort the process."""
+    logger.error(f"Unhandled error in UI: {exc}", exc_info=(exc_type, exc, tb))
+
+
+def create_application():
+    """Return the QApplication, creating and configuring it if none exists yet."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+        app.setApplicationName("Jarvis AI Assistant")
+        app.setQuitOnLastWindowClosed(False)
+    return app
+
+
+@lru_cache(maxsize=None)
+def _font(size: int, bold: bool = False) -> QFont:
+    """Return a shared Segoe UI font (built on first use, once a QApplication exists)."""
+    if bold:
+        return QFont("Segoe UI", size, QFont.Weight.Bold)
+    return QFont("Segoe UI", size)
+
 
-class MessageBubble(QFrame):
-    """Custom message bubble widget with modern styling."""
+# Outer margins (left, top, right, bottom), corner radius and text colour of each bubble kind
+_BUBBLE_MARGINS = {
+    "user": (5, 5, 50, 5),
+    "system": (20, 5, 20, 5),
+    "ai": (50, 5, 5, 5),
+}
+_BUBBLE_RADIUS = {"user": 18, "system": 12, "ai": 18}
+_BUBBLE_TEXT_COLORS = {"user": "#ffffff", "system": "#ccffffff", "ai": "#ffffff"}
+
+# Bubble rich text per kind, filled with %-formatting: (sender, time, message), all escaped
+_BUBBLE_HTML = {
+    kind: (
+        '<table width="100%%" cellspacing="0" cellpadding="0" style="margin-bottom: 5px">'
+        '<tr><td style="color: ' + color + '; font-size: 9pt; font-weight: 600">%s</td>'
+        '<td align="right" style="color: #b2ffffff; font-size: 8pt">%s</td></tr>'
+        '</table>'
+        '<p style="color: ' + color + '; white-space: pre-wrap">%s</p>'
+    )
+    for kind, color in _BUBBLE_TEXT_COLORS.items()
+}
+
+# Item data role carrying a row as a (sender, message, "HH:MM:SS", is_user) tuple
+_MESSAGE_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+def _bubble_kind(sender: str, is_user: bool) -> str:
+    """Return the bubble style used for a message."""
+    if is_user:
+        return "user"
+    if sender == "System":
+        return "system"
+    return "ai"
+
+
+class ChatModel(QAbstractListModel):
+    """List model holding chat messages; widgets are never created per message."""
     
-    def __init__(self, sender: str, message: str, timestamp: datetime, is_user: bool = False):
-        super().__init__()
-        self.sender = sender
-        self.message = message
-        self.timestamp = timestamp
-        self.is_user = is_user
-        
-        self.setup_ui()
-        self.apply_styling()
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # One column per field rather than one object per message
+        self.senders = []
+        self.messages = []
+        self.timestamps = array("d")  # Epoch seconds
+        self.time_labels = []  # "HH:MM:SS", formatted once on insert
+        self.is_user = bytearray()
     
-    def setup_ui(self):
-        """Setup the message bubble UI."""
-        layout = QVBoxLayout()
-        layout.setContentsMargins(15, 10, 15, 10)
-        layout.setSpacing(5)
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.messages)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == _MESSAGE_ROLE:
+            return (self.senders[row], self.messages[row], self.time_labels[row], bool(self.is_user[row]))
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{self.senders[row]}: {self.messages[row]}"
+        return None
+    
+    def extend(self, items: list):
+        """Append (sender, message, timestamp, is_user) messages with a single row insert."""
+        if not items:
+            return
+        first = len(self.messages)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        for sender, message, timestamp, is_user in items:
+            self.senders.append(sender)
+            self.messages.append(message)
+            self.timestamps.append(timestamp.timestamp())
+            self.time_labels.append(timestamp.strftime("%H:%M:%S"))
+            self.is_user.append(is_user)
+        self.endInsertRows()
+    
+    def set_message(self, row: int, message: str) -> tuple:
+        """Replace the text of a message in place; returns the previous row data."""
+        index = self.index(row)
+        old = self.data(index, _MESSAGE_ROLE)
+        self.messages[row] = message
+        self.dataChanged.emit(index, index)
+        return old
+
+
+class MessageDelegate(QStyledItemDelegate):
+    """Paints each chat message as a bubble directly onto the list view."""
+    
+    PADDING_X = 15
+    PADDING_Y = 10
+    
+    # Laid-out documents kept for recently painted messages
+    DOC_CACHE_SIZE = 500
+    
+    def __init__(self, view):
+        super().__init__(view)
+        self.view = view
+        self.message_font = _font(10)
+        self._docs = OrderedDict()
+        
+        # Row sizes for the current viewport width; item views ask for them on every layout
+        self._sizes = {}
+        self._sizes_width = None
         
-        # Header with sender and timestamp
-        header_layout = QHBoxLayout()
-        header_layout.setContentsMargins(0, 0, 0, 0)
+        self.brushes = {
+            "user": self._gradient("#667eea", "#764ba2"),
+            "system": QBrush(QColor(255, 255, 255, 25)),
+            "ai": self._gradient("#2C3E50", "#34495E"),
+        }
+        self.border_pen = QPen(QColor(255, 255, 255, 51), 1)
+        self.selected_pen = QPen(QColor("#667eea"), 2)
+    
+    @staticmethod
+    def _gradient(start: str, stop: str) -> QBrush:
+        """Build a diagonal gradient brush that scales with the painted bubble."""
+        gradient = QLinearGradient(0, 0, 1, 1)
+        gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectBoundingMode)
+        gradient.setColorAt(0, QColor(start))
+        gradient.setColorAt(1, QColor(stop))
+        return QBrush(gradient)
+    
+    def _document(self, item: tuple, kind: str, width: int) -> QTextDocument:
+        """Return the laid-out document for a message row of the given width."""
+        doc = self._docs.get(item)
+        if doc is None:
+            doc = QTextDocument()
+            doc.setDocumentMargin(0)
+            doc.setDefaultFont(self.message_font)
+            sender, message, time_label, _ = item
+            doc.setHtml(_BUBBLE_HTML[kind] % (html.escape(sender), time_label, html.escape(message)))
+            self._docs[item] = doc
+            if len(self._docs) > self.DOC_CACHE_SIZE:
+                self._docs.popitem(last=False)
+        else:
+            self._docs.move_to_end(item)
         
-        sender_label = QLabel(self.sender)
-        sender_label.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
+        left, _, right, _ = _BUBBLE_MARGINS[kind]
+        text_width = max(width - left - right - 2 * self.PADDING_X, 50)
+        if doc.textWidth() != text_width:
+            doc.setTextWidth(text_width)
+        return doc
+    
+    def forget(self, item: tuple):
+        """Drop cached layout for a message that has been replaced."""
+        self._docs.pop(item, None)
+        self._sizes.pop(item, None)
+    
+    def sizeHint(self, option, index):
+        item = index.data(_MESSAGE_ROLE)
+        width = self.view.viewport().width()
+        if width != self._sizes_width:
+            self._sizes.clear()
+            self._sizes_width = width
         
-        time_label = QLabel(self.timestamp.strftime("%H:%M:%S"))
-        time_label.setFont(QFont("Segoe UI", 8))
-        time_label.setStyleSheet("color: rgba(255, 255, 255, 0.7);")
+        size = self._sizes.get(item)
+        if size is None:
+            kind = _bubble_kind(item[0], item[3])
+            doc = self._document(item, kind, width)
+            _, top, _, bottom = _BUBBLE_MARGINS[kind]
+            size = QSize(width, top + 2 * self.PADDING_Y + ceil(doc.size().height()) + bottom)
+            self._sizes[item] = size
+        return size
+    
+    def paint(self, painter, option, index):
+        item = index.data(_MESSAGE_ROLE)
+        kind = _bubble_kind(item[0], item[3])
+        left, top, right, bottom = _BUBBLE_MARGINS[kind]
+        bubble = option.rect.adjusted(left, top, -right, -bottom)
+        radius = _BUBBLE_RADIUS[kind]
         
-        header_layout.addWidget(sender_label)
-        header_layout.addStretch()
-        header_layout.addWidget(time_label)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Message content
-        message_label = QLabel(self.message)
-        message_label.setFont(QFont("Segoe UI", 10))
-        message_label.setWordWrap(True)
-        message_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        # Bubble background
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.setPen(self.selected_pen)
+        elif kind == "system":
+            painter.setPen(self.border_pen)
+        else:
+            painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.brushes[kind])
+        painter.drawRoundedRect(QRectF(bubble), radius, radius)
         
-        layout.addLayout(header_layout)
-        layout.addWidget(message_label)
+        # Header and message in one pass
+        doc = self._document(item, kind, option.rect.width())
+        painter.translate(bubble.left() + self.PADDING_X, bubble.top() + self.PADDING_Y)
+        doc.drawContents(painter)
         
-        self.setLayout(layout)
+        painter.restore()
+
+
+def _toggle_online_mode() -> bool:
+    """Flip and save online mode, then refresh the AI system prompt; returns the new state."""
+    new_state = config.toggle_online_mode()
     
-    def apply_styling(self):
-        """Apply modern styling to the message bubble."""
-        if self.is_user:
-            # User message - right aligned, blue gradient
-            self.setStyleSheet("""
-                QFrame {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #667eea, stop:1 #764ba2);
-                    border-radius: 18px;
-                    margin: 5px 50px 5px 5px;
-                }
-                QLabel {
-                    color: white;
-                    background: transparent;
-                }
-            """)
-        elif self.sender == "System":
-            # System message - centered, subtle styling
-            self.setStyleSheet("""
-                QFrame {
-                    background: rgba(255, 255, 255, 0.1);
-                    border: 1px solid rgba(255, 255, 255, 0.2);
-                    border-radius: 12px;
-                    margin: 5px 20px;
-                }
-                QLabel {
-                    color: rgba(255, 255, 255, 0.8);
-                    background: transparent;
-                }
-            """)
-        else:
-            # AI message - left aligned, dark gradient
-            self.setStyleSheet("""
-                QFrame {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #2C3E50, stop:1 #34495E);
-                    border-radius: 18px;
-                    margin: 5px 5px 5px 50px;
-                }
-                QLabel {
-                    color: white;
-                    background: transparent;
-                }
-            """)
+    # Notify AI engine to refresh system prompt
+    try:
+        from ..core.ai_engine import ai_engine
+        ai_engine.system_prompt = ai_engine._build_system_prompt()
+        logger.info("AI engine system prompt updated with new online/offline state")
+    except Exception as e:
+        logger.error(f"Error updating AI engine system prompt: {e}")
+    
+    return new_state
+
+
+# Chat window stylesheet, parsed by Qt once per window; the online toggle switches
+# between its two looks through the "mode" property instead of a new stylesheet
+_WINDOW_QSS = """
+    QMainWindow {
+        background: rgba(20, 20, 30, 0.9);
+        border-radius: 15px;
+    }
+    
+    QFrame {
+        background: rgba(30, 30, 40, 0.8);
+        border-radius: 10px;
+        border: 1px solid rgba(255, 255, 255, 0.1);
+    }
+    
+    QLabel {
+        color: white;
+        background: transparent;
+    }
+    
+    QLineEdit {
+        background: rgba(255, 255, 255, 0.1);
+        border: 2px solid rgba(255, 255, 255, 0.2);
+        border-radius: 20px;
+        padding: 10px 15px;
+        color: white;
+        font-size: 11px;
+    }
+    
+    QLineEdit:focus {
+        border: 2px solid #667eea;
+    }
+    
+    QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #667eea, stop:1 #764ba2);
+        border: none;
+        border-radius: 20px;
+        color: white;
+        font-weight: bold;
+    }
+    
+    QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #7c8ef0, stop:1 #8a5cb8);
+    }
+    
+    QPushButton:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #5a6bd8, stop:1 #6a4a9c);
+    }
+    
+    QListView {
+        background: transparent;
+        border: none;
+    }
+    
+    QScrollBar:vertical {
+        background: rgba(255, 255, 255, 0.1);
+        width: 8px;
+        border-radius: 4px;
+    }
+    
+    QScrollBar::handle:vertical {
+        background: rgba(255, 255, 255, 0.3);
+        border-radius: 4px;
+        min-height: 20px;
+    }
+    
+    QScrollBar::handle:vertical:hover {
+        background: rgba(255, 255, 255, 0.5);
+    }
+    
+    QPushButton#onlineToggle {
+        border: none;
+        border-radius: 12px;
+        color: white;
+        font-weight: bold;
+        font-size: 9px;
+    }
+    
+    QPushButton#onlineToggle[mode="online"] {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #28a745, stop:1 #20c997);
+    }
+    
+    QPushButton#onlineToggle[mode="online"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #34ce57, stop:1 #2dd4aa);
+    }
+    
+    QPushButton#onlineToggle[mode="online"]:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #1e7e34, stop:1 #1a9e7e);
+    }
+    
+    QPushButton#onlineToggle[mode="offline"] {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #6c757d, stop:1 #495057);
+    }
+    
+    QPushButton#onlineToggle[mode="offline"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #7a8288, stop:1 #545b62);
+    }
+    
+    QPushButton#onlineToggle[mode="offline"]:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #5a6268, stop:1 #3d4449);
+    }
+"""
 
 
 class ChatWindow(QMainWindow):
@@ -137,11 +432,43 @@ class ChatWindow(QMainWindow):
     # Signals for thread-safe communication
     message_received = pyqtSignal(str, str, datetime)
     status_changed = pyqtSignal(str)
+    stream_started = pyqtSignal(int, str, datetime)
+    stream_chunk = pyqtSignal(int, str)
+    stream_ended = pyqtSignal(int)
+    online_mode_changed = pyqtSignal(object)  # New state, or the exception raised
+    
+    # Messages arriving within this window are inserted and laid out together
+    APPEND_BATCH_MS = 50
+    SCROLL_DELAY_MS = 50
     
     def __init__(self, ui_manager=None):
         super().__init__()
         self.send_callback = None
         self.ui_manager = ui_manager  # Reference to UIManager for settings
+        self._last_online_state = None  # State the online button currently shows
+        self._worker = None  # Created on first use by _background()
+        
+        # Window dragging by the title bar
+        self.drag_position = QPoint()
+        self._dragging = False
+        
+        # Streamed messages: id -> [row, text so far]; ids with unflushed chunks
+        self._stream_ids = itertools.count(1)
+        self._streams = {}
+        self._dirty_streams = set()
+        
+        self._pending = []
+        self._append_timer = QTimer(self)
+        self._append_timer.setSingleShot(True)
+        self._append_timer.setInterval(self.APPEND_BATCH_MS)
+        self._append_timer.timeout.connect(self._flush_pending)
+        
+        # Restarted on every flush, so a run of batches ends in a single scroll
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(self.SCROLL_DELAY_MS)
+        self._scroll_timer.timeout.connect(self.scroll_to_bottom)
+        
         self.setup_ui()
         self.apply_styling()
         self.setup_signals()
@@ -181,25 +508,32 @@ class ChatWindow(QMainWindow):
         main_layout.setSpacing(15)
         
         # Title bar
-        title_bar = self.create_title_bar()
-        main_layout.addWidget(title_bar)
-        
-        # Chat area
-        self.chat_scroll = QScrollArea()
-        self.chat_scroll.setWidgetResizable(True)
-        self.chat_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.chat_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.title_bar = self.create_title_bar()
+        main_layout.addWidget(self.title_bar)
         
-        self.chat_widget = QWidget()
-        self.chat_layout = QVBoxLayout()
-        self.chat_layout.setContentsMargins(10, 10, 10, 10)
-        self.chat_layout.setSpacing(10)
-        self.chat_layout.addStretch()  # Push messages to bottom
+        # Chat area: messages live in a model and are painted by a delegate, so
+        # only the rows in the viewport cost anything to draw
+        self.chat_model = ChatModel(self)
+        self.chat_view = QListView()
+        self.chat_view.setModel(self.chat_model)
+        self.message_delegate = MessageDelegate(self.chat_view)
+        self.chat_view.setItemDelegate(self.message_delegate)
+        self.chat_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.chat_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.chat_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.chat_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.chat_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.chat_view.setSpacing(5)
         
-        self.chat_widget.setLayout(self.chat_layout)
-        self.chat_scroll.setWidget(self.chat_widget)
+        # Copy selected messages via Ctrl+C or the context menu
+        copy_action = QAction("Copy", self.chat_view)
+        copy_action.setShortcut(QKeySequence.StandardKey.Copy)
+        copy_action.setShortcutContext(Qt.ShortcutContext.WidgetShortcut)
+        copy_action.triggered.connect(self.copy_selected_messages)
+        self.chat_view.addAction(copy_action)
+        self.chat_view.setContextMenuPolicy(Qt.ContextMenuPolicy.ActionsContextMenu)
         
-        main_layout.addWidget(self.chat_scroll, 1)
+        main_layout.addWidget(self.chat_view, 1)
         
         # Input area
         input_area = self.create_input_area()
@@ -207,7 +541,7 @@ class ChatWindow(QMainWindow):
         
         # Status bar
         self.status_label = QLabel("Ready")
-        self.status_label.setFont(QFont("Segoe UI", 9))
+        self.status_label.setFont(_font(9))
         main_layout.addWidget(self.status_label)
         
         central_widget.setLayout(main_layout)
@@ -222,10 +556,11 @@ class ChatWindow(QMainWindow):
         
         # Title
         title_label = QLabel("Jarvis AI Assistant")
-        title_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title_label.setFont(_font(12, bold=True))
         
         # Online/Offline toggle button
         self.online_toggle_btn = QPushButton()
+        self.online_toggle_btn.setObjectName("onlineToggle")
         self.online_toggle_btn.setFixedSize(80, 25)
         self.online_toggle_btn.setToolTip("Toggle Online/Offline Mode")
         self.online_toggle_btn.clicked.connect(self.toggle_online_mode)
@@ -267,13 +602,13 @@ class ChatWindow(QMainWindow):
         
         # Input field
         self.input_field = QLineEdit()
-        self.input_field.setFont(QFont("Segoe UI", 11))
+        self.input_field.setFont(_font(11))
         self.input_field.setPlaceholderText("Type your message here...")
         self.input_field.returnPressed.connect(self.send_message)
         
         # Send button
         self.send_button = QPushButton("Send")
-        self.send_button.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+        self.send_button.setFont(_font(10, bold=True))
         self.send_button.setFixedSize(80, 40)
         self.send_button.clicked.connect(self.send_message)
         
@@ -285,81 +620,16 @@ class ChatWindow(QMainWindow):
     
     def apply_styling(self):
         """Apply modern styling with transparency and gradients."""
-        self.setStyleSheet("""
-            QMainWindow {
-                background: rgba(20, 20, 30, 0.9);
-                border-radius: 15px;
-            }
-            
-            QFrame {
-                background: rgba(30, 30, 40, 0.8);
-                border-radius: 10px;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-            }
-            
-            QLabel {
-                color: white;
-                background: transparent;
-            }
-            
-            QLineEdit {
-                background: rgba(255, 255, 255, 0.1);
-                border: 2px solid rgba(255, 255, 255, 0.2);
-                border-radius: 20px;
-                padding: 10px 15px;
-                color: white;
-                font-size: 11px;
-            }
-            
-            QLineEdit:focus {
-                border: 2px solid #667eea;
-            }
-            
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #667eea, stop:1 #764ba2);
-                border: none;
-                border-radius: 20px;
-                color: white;
-                font-weight: bold;
-            }
-            
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #7c8ef0, stop:1 #8a5cb8);
-            }
-            
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #5a6bd8, stop:1 #6a4a9c);
-            }
-            
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            
-            QScrollBar:vertical {
-                background: rgba(255, 255, 255, 0.1);
-                width: 8px;
-                border-radius: 4px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background: rgba(255, 255, 255, 0.3);
-                border-radius: 4px;
-                min-height: 20px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background: rgba(255, 255, 255, 0.5);
-            }
-        """)
+        self.setStyleSheet(_WINDOW_QSS)
     
     def setup_signals(self):
         """Setup signal connections."""
         self.message_received.connect(self.add_message_to_chat)
         self.status_changed.connect(self.update_status)
+        self.stream_started.connect(self._on_stream_started)
+        self.stream_chunk.connect(self._on_stream_chunk)
+        self.stream_ended.connect(self._on_stream_ended)
+        self.online_mode_changed.connect(self._on_online_mode_changed)
     
     def set_send_callback(self, callback: Callable):
         """Set the callback for sending messages."""
@@ -378,18 +648,29 @@ class ChatWindow(QMainWindow):
             # Update status
             self.status_changed.emit("Processing...")
             
-            # Call callback in separate thread
-            def send_async():
-                try:
-                    self.send_callback(text)
-                except Exception as e:
-                    logger.error(f"Error in send callback: {e}")
-                    self.message_received.emit("System", f"Error: {e}", datetime.now())
-                finally:
-                    self.status_changed.emit("Ready")
+            # The callback schedules the work on the assistant's event loop and returns its future
+            try:
+                future = self.send_callback(text)
+            except Exception as e:
+                logger.error(f"Error in send callback: {e}")
+                self.message_received.emit("System", f"Error: {e}", datetime.now())
+                future = None
             
-            thread = threading.Thread(target=send_async, daemon=True)
-            thread.start()
+            if future is None:
+                self.status_changed.emit("Ready")
+            else:
+                future.add_done_callback(self._on_send_done)
+    
+    def _on_send_done(self, future):
+        """Report the outcome of a sent message (may run off the GUI thread)."""
+        try:
+            e = future.exception()
+        except Exception as cancel_error:
+            e = cancel_error
+        if e is not None:
+            logger.error(f"Error in send callback: {e}")
+            self.message_received.emit("System", f"Error: {e}", datetime.now())
+        self.status_changed.emit("Ready")
     
     def add_message(self, sender: str, message: str, timestamp: datetime, is_user: bool = False):
         """Add message to chat (thread-safe via signal)."""
@@ -397,25 +678,90 @@ class ChatWindow(QMainWindow):
     
     def add_message_to_chat(self, sender: str, message: str, timestamp: datetime):
         """Add message to chat display (called from signal)."""
+        # Hot path: no try/except here, errors reach _log_slot_error via sys.excepthook
+        self._pending.append((sender, message, timestamp, sender == "You"))
+        if not self._append_timer.isActive():
+            self._append_timer.start()
+    
+    def bulk_add(self, messages: list):
+        """Add many (sender, message, timestamp) messages with one relayout (GUI thread only)."""
+        self._append_timer.stop()
+        self._pending.extend((sender, message, timestamp, sender == "You")
+                             for sender, message, timestamp in messages)
+        
+        # Hold repaints until the whole batch is in the model
+        self.chat_view.setUpdatesEnabled(False)
         try:
-            is_user = (sender == "You")
-            
-            # Create message bubble
-            bubble = MessageBubble(sender, message, timestamp, is_user)
-            
-            # Insert before the stretch
-            self.chat_layout.insertWidget(self.chat_layout.count() - 1, bubble)
-            
-            # Scroll to bottom
-            QTimer.singleShot(100, self.scroll_to_bottom)
-            
-        except Exception as e:
-            logger.error(f"Error adding message to chat: {e}")
+            self._flush_pending()
+        finally:
+            self.chat_view.setUpdatesEnabled(True)
+    
+    def _flush_pending(self):
+        """Insert all queued messages at once and scroll to them."""
+        batch, self._pending = self._pending, []
+        self.chat_model.extend(batch)
+        
+        # Apply streamed text once per batch rather than once per chunk
+        for stream_id in self._dirty_streams:
+            row, text = self._streams[stream_id]
+            old = self.chat_model.set_message(row, text)
+            self.message_delegate.forget(old)
+            self.message_delegate.sizeHintChanged.emit(self.chat_model.index(row))
+        self._dirty_streams.clear()
+        
+        # Scroll to bottom
+        self._scroll_timer.start()
+    
+    def start_stream(self, sender: str, timestamp: Optional[datetime] = None) -> int:
+        """Open a message that later chunks are appended to (thread-safe via signal)."""
+        stream_id = next(self._stream_ids)
+        self.stream_started.emit(stream_id, sender, timestamp or datetime.now())
+        return stream_id
+    
+    def append_stream(self, stream_id: int, chunk: str):
+        """Append text to a streamed message (thread-safe via signal)."""
+        self.stream_chunk.emit(stream_id, chunk)
+    
+    def end_stream(self, stream_id: int):
+        """Finish a streamed message (thread-safe via signal)."""
+        self.stream_ended.emit(stream_id)
+    
+    def _on_stream_started(self, stream_id: int, sender: str, timestamp: datetime):
+        """Add the empty message row for a new stream after anything already queued."""
+        self._append_timer.stop()
+        self._pending.append((sender, "", timestamp, sender == "You"))
+        self._flush_pending()
+        self._streams[stream_id] = [self.chat_model.rowCount() - 1, ""]
+    
+    def _on_stream_chunk(self, stream_id: int, chunk: str):
+        """Buffer a chunk; it reaches the model with the next batch."""
+        stream = self._streams.get(stream_id)
+        if stream is not None:
+            stream[1] += chunk
+            self._dirty_streams.add(stream_id)
+            if not self._append_timer.isActive():
+                self._append_timer.start()
+    
+    def _on_stream_ended(self, stream_id: int):
+        """Flush the remaining text of a stream and stop tracking it."""
+        if stream_id in self._dirty_streams:
+            self._append_timer.stop()
+            self._flush_pending()
+        self._streams.pop(stream_id, None)
     
     def scroll_to_bottom(self):
         """Scroll chat to bottom."""
-        scrollbar = self.chat_scroll.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        # Unlike setting the scrollbar to maximum(), this first runs any pending item
+        # layout, so the range already includes the rows just inserted
+        self.chat_view.scrollToBottom()
+    
+    def copy_selected_messages(self):
+        """Copy the selected messages to the clipboard."""
+        rows = sorted(index.row() for index in self.chat_view.selectedIndexes())
+        if rows:
+            QApplication.clipboard().setText(
+                "\n".join(self.chat_model.index(row).data() for row in rows)
+            )
     
     def update_status(self, status: str):
         """Update status label."""
@@ -424,79 +770,63 @@ class ChatWindow(QMainWindow):
     def toggle_online_mode(self):
         """Toggle between online and offline mode."""
         try:
-            # Toggle the mode using config
-            new_state = config.toggle_online_mode()
-            
-            # Update button appearance
-            self.update_online_button()
-            
-            # Notify AI engine to refresh system prompt
-            try:
-                from ..core.ai_engine import ai_engine
-                ai_engine.system_prompt = ai_engine._build_system_prompt()
-                logger.info("AI engine system prompt updated with new online/offline state")
-            except Exception as e:
-                logger.error(f"Error updating AI engine system prompt: {e}")
-            
-            # Show status message
-            mode_text = "Online" if new_state else "Offline"
-            self.add_message("System", f"Switched to {mode_text} mode", datetime.now())
-            
-            logger.info(f"Online mode toggled to: {new_state}")
+            # Saving the config and rebuilding the prompt happen on the worker thread;
+            # the button stays disabled until the result comes back
+            self.online_toggle_btn.setEnabled(False)
+            future = self._background().submit(_toggle_online_mode)
+            future.add_done_callback(
+                lambda f: self.online_mode_changed.emit(f.exception() or f.result())
+            )
             
         except Exception as e:
+            self.online_toggle_btn.setEnabled(True)
             logger.error(f"Error toggling online mode: {e}")
             self.add_message("System", f"Error toggling online mode: {e}", datetime.now())
     
+    def _on_online_mode_changed(self, result):
+        """Reflect a finished online/offline toggle (called from signal)."""
+        self.online_toggle_btn.setEnabled(True)
+        if isinstance(result, Exception):
+            logger.error(f"Error toggling online mode: {result}")
+            self.add_message("System", f"Error toggling online mode: {result}", datetime.now())
+            return
+        
+        # Update button appearance
+        self.update_online_button()
+        
+        # Show status message
+        mode_text = "Online" if result else "Offline"
+        self.add_message("System", f"Switched to {mode_text} mode", datetime.now())
+        
+        logger.info(f"Online mode toggled to: {result}")
+    
+    def _background(self) -> ThreadPoolExecutor:
+        """Return the single worker used for blocking work triggered from the window."""
+        if self._worker is None:
+            self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jarvis-chat")
+        return self._worker
+    
     def update_online_button(self):
         """Update the online/offline button appearance based on current state."""
         try:
             is_online = config.is_online_mode()
+            if is_online == self._last_online_state:
+                return
+            self._last_online_state = is_online
             
             if is_online:
                 # Online state - green with globe icon
                 self.online_toggle_btn.setText("🌐 Online")
-                self.online_toggle_btn.setStyleSheet("""
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                            stop:0 #28a745, stop:1 #20c997);
-                        border: none;
-                        border-radius: 12px;
-                        color: white;
-                        font-weight: bold;
-                        font-size: 9px;
-                    }
-                    QPushButton:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                            stop:0 #34ce57, stop:1 #2dd4aa);
-                    }
-                    QPushButton:pressed {
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                            stop:0 #1e7e34, stop:1 #1a9e7e);
-                    }
-                """)
+                self.online_toggle_btn.setProperty("mode", "online")
             else:
                 # Offline state - gray with lock icon
                 self.online_toggle_btn.setText("🔒 Offline")
-                self.online_toggle_btn.setStyleSheet("""
-                    QPushButton {
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                            stop:0 #6c757d, stop:1 #495057);
-                        border: none;
-                        border-radius: 12px;
-                        color: white;
-                        font-weight: bold;
-                        font-size: 9px;
-                    }
-                    QPushButton:hover {
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                            stop:0 #7a8288, stop:1 #545b62);
-                    }
-                    QPushButton:pressed {
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                            stop:0 #5a6268, stop:1 #3d4449);
-                    }
-                """)
+                self.online_toggle_btn.setProperty("mode", "offline")
+            
+            # Re-evaluate the window stylesheet's [mode] selectors for this button only
+            style = self.online_toggle_btn.style()
+            style.unpolish(self.online_toggle_btn)
+            style.polish(self.online_toggle_btn)
             
         except Exception as e:
             logger.error(f"Error updating online button: {e}")
@@ -518,16 +848,25 @@ class ChatWindow(QMainWindow):
             self.add_message("System", f"Error opening settings: {e}", datetime.now())
     
     def mousePressEvent(self, event):
-        """Handle mouse press for window dragging."""
+        """Handle mouse press for window dragging (title bar only)."""
         if event.button() == Qt.MouseButton.LeftButton:
-            self.drag_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
-            event.accept()
+            pos = self.title_bar.mapFrom(self, event.position().toPoint())
+            self._dragging = self.title_bar.rect().contains(pos)
+            if self._dragging:
+                self.drag_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+                event.accept()
     
     def mouseMoveEvent(self, event):
         """Handle mouse move for window dragging."""
-        if event.buttons() == Qt.MouseButton.LeftButton and hasattr(self, 'drag_position'):
+        if not self._dragging:
+            return
+        if event.buttons() == Qt.MouseButton.LeftButton:
             self.move(event.globalPosition().toPoint() - self.drag_position)
             event.accept()
+    
+    def mouseReleaseEvent(self, event):
+        """End window dragging."""
+        self._dragging = False
 
 
 class UIManager:
@@ -541,6 +880,14 @@ class UIManager:
         self.shutdown_callback = None
         self.initialized = False
         
+        # Event loop that runs message callbacks; a private one is started only if none is running
+        self._main_loop = None
+        self._loop = None
+        self._loop_thread = None
+        
+        # True when the running loop is a qasync.QEventLoop, which dispatches Qt events itself
+        self.native_events = False
+        
         # System tray
         self.tray_icon = None
     
@@ -553,17 +900,22 @@ class UIManager:
             
             logger.info("Initializing PyQt6 UI manager...")
             
+            self._main_loop = asyncio.get_running_loop()
+            self.native_events = QASYNC_AVAILABLE and isinstance(self._main_loop, qasync.QEventLoop)
+            
             # Create QApplication if it doesn't exist
-            if not QApplication.instance():
-                self.app = QApplication(sys.argv)
-                self.app.setApplicationName("Jarvis AI Assistant")
-                self.app.setQuitOnLastWindowClosed(False)
-            else:
-                self.app = QApplication.instance()
+            self.app = create_application()
+            
+            # One handler for errors raised in slots, instead of try/except in each hot slot
+            if sys.excepthook is sys.__excepthook__:
+                sys.excepthook = _log_slot_error
             
             # Setup system tray
             self.setup_system_tray()
             
+            # Load plyer and the settings window on a worker thread while the UI comes up
+            self._main_loop.run_in_executor(None, _warm_imports)
+            
             self.initialized = True
             logger.info("PyQt6 UI manager initialized successfully")
             return True
@@ -579,9 +931,7 @@ class UIManager:
                 self.tray_icon = QSystemTrayIcon()
                 
                 # Create a simple icon (you can replace with actual icon file)
-                pixmap = QPixmap(16, 16)
-                pixmap.fill(QColor(102, 126, 234))  # Blue color
-                self.tray_icon.setIcon(QIcon(pixmap))
+                self.tray_icon.setIcon(_get_tray_icon())
                 
                 # Create tray menu
                 tray_menu = QMenu()
@@ -619,11 +969,11 @@ class UIManager:
                 self.chat_window.set_send_callback(self._on_chat_message)
                 
                 # Add welcome message
-                self.chat_window.add_message(
+                self.chat_window.bulk_add([(
                     "System",
                     "Jarvis AI Assistant ready! Type your message below.",
                     datetime.now()
-                )
+                )])
             
             self.chat_window.show()
             self.chat_window.raise_()
@@ -668,16 +1018,23 @@ class UIManager:
             logger.error(f"Error showing settings window: {e}")
     
     def _on_chat_message(self, message: str):
-        """Handle chat message from user."""
+        """Handle chat message from user; returns the future of the scheduled callback."""
         try:
             logger.info(f"Chat message received: {message}")
             
             if self.message_callback:
-                # Create new event loop for this thread
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self.message_callback(message, "text"))
-                loop.close()
+                try:
+                    # Qt is pumped from the assistant's event loop, so schedule there directly
+                    asyncio.get_running_loop()
+                    return asyncio.ensure_future(self.message_callback(message, "text"))
+                except RuntimeError:
+                    # Called off-loop (e.g. under app.exec()): use the assistant's loop, or a private one
+                    loop = self._main_loop
+                    if loop is None or not loop.is_running():
+                        loop = self._ensure_loop()
+                    return asyncio.run_coroutine_threadsafe(
+                        self.message_callback(message, "text"), loop
+                    )
                 
         except Exception as e:
             logger.error(f"Error handling chat message: {e}")
@@ -687,6 +1044,20 @@ class UIManager:
                     f"Error processing message: {e}",
                     datetime.now()
                 )
+        return None
+    
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the fallback event loop used when no assistant loop is running."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+            
+            def run_loop():
+                asyncio.set_event_loop(self._loop)
+                self._loop.run_forever()
+            
+            self._loop_thread = threading.Thread(target=run_loop, name="jarvis-ui-loop", daemon=True)
+            self._loop_thread.start()
+        return self._loop
     
     def show_response(self, user_input: str, ai_response: str):
         """Show AI response in the chat."""
@@ -696,26 +1067,53 @@ class UIManager:
             if self.chat_window:
                 self.chat_window.add_message("Jarvis", ai_response, datetime.now())
             
-            # Show notification for short responses
-            if len(ai_response) < 100 and PLYER_AVAILABLE:
-                try:
-                    notification.notify(
-                        title="Jarvis",
-                        message=ai_response[:100],
-                        timeout=5,
-                        app_name="Jarvis AI Assistant"
-                    )
-                except Exception as e:
-                    logger.error(f"Notification error: {e}")
+            self._notify_response(ai_response)
                     
         except Exception as e:
             logger.error(f"Error showing response: {e}")
     
+    def show_response_stream(self, user_input: str, chunks: Iterable[str]) -> str:
+        """Show an AI response as it arrives, growing a single chat message; returns the full text."""
+        parts = []
+        stream_id = None
+        try:
+            if self.chat_window:
+                stream_id = self.chat_window.start_stream("Jarvis")
+            
+            for chunk in chunks:
+                parts.append(chunk)
+                if stream_id is not None:
+                    self.chat_window.append_stream(stream_id, chunk)
+            
+            ai_response = "".join(parts)
+            logger.info(f"Showing response: {ai_response[:50]}...")
+            self._notify_response(ai_response)
+            
+        except Exception as e:
+            logger.error(f"Error showing streamed response: {e}")
+        finally:
+            if stream_id is not None:
+                self.chat_window.end_stream(stream_id)
+        return "".join(parts)
+    
+    def _notify_response(self, ai_response: str):
+        """Show a notification for short responses."""
+        if len(ai_response) < 100 and PLYER_AVAILABLE:
+            try:
+                _get_notifier()(
+                    title="Jarvis",
+                    message=ai_response[:100],
+                    timeout=5,
+                    app_name="Jarvis AI Assistant"
+                )
+            except Exception as e:
+                logger.error(f"Notification error: {e}")
+    
     def show_notification(self, title: str, message: str, timeout: int = 5):
         """Show system notification."""
         try:
             if PLYER_AVAILABLE:
-                notification.notify(
+                _get_notifier()(
                     title=title,
                     message=message,
                     timeout=timeout,
@@ -734,10 +1132,16 @@ class UIManager:
         """Set callback for shutdown requests."""
         self.shutdown_callback = callback
     
+    @property
+    def tick_interval(self) -> float:
+        """Seconds the UI loop should sleep between process_events calls."""
+        # With qasync the loop only needs to notice shutdown; otherwise poll at ~100 Hz
+        return 0.5 if self.native_events else 0.01
+    
     async def process_events(self):
-        """Process UI events."""
+        """Process UI events (a no-op when qasync already dispatches them)."""
         try:
-            if self.app:
+            if self.app and not self.native_events:
                 self.app.processEvents()
         except Exception as e:
             logger.error(f"Error processing UI events: {e}")
@@ -748,7 +1152,9 @@ class UIManager:
             if self.shutdown_callback:
                 self.shutdown_callback()
             
-            if self.app:
+            # Under qasync, quitting Qt would stop the asyncio loop under the running
+            # assistant; the shutdown callback already makes it return on its own
+            if self.app and not (self.native_events and self.shutdown_callback):
                 self.app.quit()
                 
         except Exception as e:
@@ -765,6 +1171,10 @@ class UIManager:
             if self.tray_icon:
                 self.tray_icon.hide()
             
+            if self._loop and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
+            
             self.initialized = False
             logger.info("PyQt6 UI manager cleanup complete")
             
@@ -781,11 +1191,10 @@ def test_pyqt_ui():
     
     print("Testing PyQt6 UI manager...")
     
-    def test_callback(message):
+    async def test_callback(message):
         print(f"Callback received: {message}")
         # Simulate AI response
-        import time
-        time.sleep(1)
+        await asyncio.sleep(1)
         ui.show_response(message, f"I received your message: '{message}'. This is a test response from the modern PyQt6 interface!")
     
     try:
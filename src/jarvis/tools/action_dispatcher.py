@@ -6,6 +6,9 @@ Handles comprehensive file operations, screen analysis, and temp file management
 import asyncio
 import re
 import os
+import fnmatch
+import mmap
+from stat import S_ISDIR, S_ISREG
 import shutil
 import subprocess
 from typing import Dict, Any, List, Optional, Tuple
@@ -15,6 +18,7 @@ import time
 from datetime import datetime, timedelta
 import psutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import requests
@@ -45,6 +49,96 @@ except ImportError:
     logger.warning("UI automation not available - install pyautogui and pygetwindow")
 
 
+# Directory listings of one tree level are read concurrently; the pool size also
+# bounds how many scandir handles are open at once
+_SCAN_WORKERS = 8
+_scan_pool = ThreadPoolExecutor(max_workers=_SCAN_WORKERS, thread_name_prefix="jarvis-scan")
+
+
+def _scan(directory: str) -> list:
+    """Return the entries of one directory, or none if it can't be read."""
+    try:
+        with os.scandir(directory) as it:
+            return list(it)
+    except OSError:
+        # Skip directories we can't access
+        return []
+
+
+class _GlobEntry:
+    """os.DirEntry-like view of a Path, for results that come from Path.glob."""
+    
+    __slots__ = ("_path", "name", "path")
+    
+    def __init__(self, path: Path):
+        self._path = path
+        self.name = path.name
+        self.path = str(path)
+    
+    def stat(self) -> os.stat_result:
+        """Stat the path, following symlinks like DirEntry.stat()."""
+        return self._path.stat()
+    
+    def is_file(self) -> bool:
+        """Whether the path is a regular file."""
+        return self._path.is_file()
+    
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        """Whether the path is a directory, optionally without following symlinks."""
+        if not follow_symlinks and self._path.is_symlink():
+            return False
+        return self._path.is_dir()
+
+
+def _walk(root: str, pattern: str = "*", recursive: bool = False):
+    """Yield entries under root matching pattern, with the results of Path.glob/rglob."""
+    # Only plain name patterns can be matched per entry; patterns with a path
+    # component or "**" keep Path.glob semantics
+    if "/" in pattern or os.sep in pattern or "**" in pattern:
+        paths = Path(root).rglob(pattern) if recursive else Path(root).glob(pattern)
+        for path in paths:
+            yield _GlobEntry(path)
+        return
+    
+    # One scandir per directory, each level's directories read in parallel; DirEntry
+    # caches its type and stat() result, so callers stat each entry at most once
+    match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+    pending = [root]
+    while pending:
+        if len(pending) == 1:
+            listings = [_scan(pending[0])]
+        else:
+            listings = _scan_pool.map(_scan, pending)
+        pending = []
+        
+        for entries in listings:
+            for entry in entries:
+                if match(os.path.normcase(entry.name)):
+                    yield entry
+                if recursive:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                    except OSError:
+                        continue
+
+
+def _file_contains(path: str, size: int, query_lower: str, pattern=None) -> bool:
+    """Case-insensitively check whether a text file contains the query."""
+    try:
+        if size == 0:
+            return query_lower == ""
+        if pattern is not None:
+            # ASCII query: scan the mapped bytes in C instead of decoding and lowering a copy
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return pattern.search(mm) is not None
+        with open(path, 'r', encoding='utf-8') as f:
+            return query_lower in f.read().lower()
+    except (OSError, ValueError):
+        # Unreadable or not UTF-8 (UnicodeDecodeError is a ValueError)
+        return False
+
+
 class TempFileManager:
     """Manages temporary files and folders for Jarvis."""
     
@@ -94,20 +188,20 @@ class TempFileManager:
             if hours is None:
                 hours = self.cleanup_interval
             
-            cutoff_time = datetime.now() - timedelta(hours=hours)
+            cutoff = (datetime.now() - timedelta(hours=hours)).timestamp()
             deleted_files = []
             total_size_freed = 0
             
-            for folder in self.temp_root.iterdir():
+            for folder in _scan(str(self.temp_root)):
                 if folder.is_dir():
-                    for file in folder.iterdir():
+                    for file in _scan(folder.path):
                         if file.is_file():
-                            file_time = datetime.fromtimestamp(file.stat().st_mtime)
-                            if file_time < cutoff_time:
-                                size = file.stat().st_size
-                                file.unlink()
-                                deleted_files.append(str(file))
-                                total_size_freed += size
+                            # One cached stat per file serves both the age check and the size
+                            stat = file.stat()
+                            if stat.st_mtime < cutoff:
+                                os.unlink(file.path)
+                                deleted_files.append(file.path)
+                                total_size_freed += stat.st_size
             
             return {
                 "success": True,
@@ -126,12 +220,12 @@ class TempFileManager:
             total_size = 0
             file_counts = {}
             
-            for folder in self.temp_root.iterdir():
+            for folder in _scan(str(self.temp_root)):
                 if folder.is_dir():
                     folder_size = 0
                     file_count = 0
                     
-                    for file in folder.iterdir():
+                    for file in _scan(folder.path):
                         if file.is_file():
                             folder_size += file.stat().st_size
                             file_count += 1
@@ -187,14 +281,16 @@ class SafetyManager:
                         "reason": f"Path is in restricted directory: {restricted}"
                     }
             
-            # Check if path exists
-            if not path_obj.exists():
+            # Check if path exists; the same stat tells callers the file type and size
+            try:
+                path_stat = os.stat(path_str)
+            except (FileNotFoundError, NotADirectoryError):
                 return {
                     "safe": False,
                     "reason": f"Path does not exist: {path}"
                 }
             
-            return {"safe": True, "resolved_path": str(path_obj)}
+            return {"safe": True, "resolved_path": path_str, "stat": path_stat}
             
         except Exception as e:
             return {
@@ -225,40 +321,14 @@ class AdvancedFileManager:
             
             path = Path(validation["resolved_path"])
             
-            if not path.is_dir():
+            if not S_ISDIR(validation["stat"].st_mode):
                 return {"success": False, "error": f"Not a directory: {directory}"}
             
-            files = []
-            dirs = []
-            total_size = 0
-            
-            if recursive:
-                items = path.rglob(pattern)
-            else:
-                items = path.glob(pattern)
-            
-            for item in items:
-                try:
-                    stat = item.stat()
-                    item_info = {
-                        "name": item.name,
-                        "path": str(item),
-                        "size": stat.st_size,
-                        "size_human": self._format_size(stat.st_size),
-                        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                        "extension": item.suffix.lower() if item.is_file() else None
-                    }
-                    
-                    if item.is_file():
-                        files.append(item_info)
-                        total_size += stat.st_size
-                    elif item.is_dir():
-                        dirs.append(item_info)
-                        
-                except (PermissionError, OSError):
-                    # Skip files we can't access
-                    continue
+            # Traversal and stat calls block, so run them off the event loop
+            loop = asyncio.get_running_loop()
+            files, dirs, total_size = await loop.run_in_executor(
+                None, self._collect_listing, str(path), pattern, recursive
+            )
             
             # Sort files and directories
             files.sort(key=lambda x: x["name"].lower())
@@ -280,6 +350,38 @@ class AdvancedFileManager:
             logger.error(f"Error listing files: {e}")
             return {"success": False, "error": str(e)}
     
+    def _collect_listing(self, directory: str, pattern: str, recursive: bool) -> Tuple[list, list, int]:
+        """Gather file and directory records for list_files (runs in a worker thread)."""
+        files = []
+        dirs = []
+        total_size = 0
+        
+        for entry in _walk(directory, pattern, recursive):
+            try:
+                stat = entry.stat()
+                is_file = S_ISREG(stat.st_mode)
+                item_info = {
+                    "name": entry.name,
+                    "path": entry.path,
+                    "size": stat.st_size,
+                    "size_human": self._format_size(stat.st_size),
+                    "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                    "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
+                    "extension": os.path.splitext(entry.name)[1].lower() if is_file else None
+                }
+                
+                if is_file:
+                    files.append(item_info)
+                    total_size += stat.st_size
+                elif S_ISDIR(stat.st_mode):
+                    dirs.append(item_info)
+                    
+            except (PermissionError, OSError):
+                # Skip files we can't access
+                continue
+        
+        return files, dirs, total_size
+    
     async def copy_file(self, source: str, destination: str) -> Dict[str, Any]:
         """Copy file or directory."""
         try:
@@ -289,16 +391,18 @@ class AdvancedFileManager:
                 return {"success": False, "error": f"Source: {source_validation['reason']}"}
             
             source_path = Path(source_validation["resolved_path"])
+            source_stat = source_validation["stat"]
+            is_file = S_ISREG(source_stat.st_mode)
             dest_path = Path(destination).expanduser().resolve()
             
             # Create destination directory if needed
             dest_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Perform copy
-            if source_path.is_file():
+            if is_file:
                 shutil.copy2(source_path, dest_path)
                 action = "copied file"
-            elif source_path.is_dir():
+            elif S_ISDIR(source_stat.st_mode):
                 shutil.copytree(source_path, dest_path, dirs_exist_ok=True)
                 action = "copied directory"
             else:
@@ -318,7 +422,7 @@ class AdvancedFileManager:
                 "source": str(source_path),
                 "destination": str(dest_path),
                 "action": action,
-                "size": source_path.stat().st_size if source_path.is_file() else "directory"
+                "size": source_stat.st_size if is_file else "directory"
             }
             
         except Exception as e:
@@ -391,11 +495,12 @@ class AdvancedFileManager:
             backup_path = self.temp_manager.temp_root / "backups" / f"{path.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             backup_path.parent.mkdir(exist_ok=True)
             
-            if path.is_file():
+            mode = validation["stat"].st_mode
+            if S_ISREG(mode):
                 shutil.copy2(path, backup_path)
                 path.unlink()
                 action = "deleted file"
-            elif path.is_dir():
+            elif S_ISDIR(mode):
                 shutil.copytree(path, backup_path)
                 shutil.rmtree(path)
                 action = "deleted directory"
@@ -429,7 +534,8 @@ class AdvancedFileManager:
                 return {"success": False, "error": validation["reason"]}
             
             path = Path(validation["resolved_path"])
-            stat = path.stat()
+            stat = validation["stat"]
+            is_file = S_ISREG(stat.st_mode)
             
             result = {
                 "success": True,
@@ -440,13 +546,13 @@ class AdvancedFileManager:
                 "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
                 "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
                 "extension": path.suffix.lower(),
-                "is_file": path.is_file(),
-                "is_directory": path.is_dir(),
+                "is_file": is_file,
+                "is_directory": S_ISDIR(stat.st_mode),
                 "permissions": oct(stat.st_mode)[-3:]
             }
             
             # Add content analysis for text files
-            if path.is_file() and path.suffix.lower() in ['.txt', '.py', '.js', '.html', '.css', '.json', '.yaml', '.yml', '.md']:
+            if is_file and path.suffix.lower() in ['.txt', '.py', '.js', '.html', '.css', '.json', '.yaml', '.yml', '.md']:
                 try:
                     with open(path, 'r', encoding='utf-8') as f:
                         content = f.read(2000)  # First 2000 characters
@@ -482,7 +588,6 @@ class AdvancedFileManager:
                 return {"success": False, "error": validation["reason"]}
             
             path = Path(validation["resolved_path"])
-            matches = []
             
             # Search pattern
             if file_type:
@@ -490,31 +595,9 @@ class AdvancedFileManager:
             else:
                 pattern = "*"
             
-            for item in path.rglob(pattern):
-                if item.is_file():
-                    # Check filename match
-                    if query.lower() in item.name.lower():
-                        matches.append({
-                            "path": str(item),
-                            "name": item.name,
-                            "size": item.stat().st_size,
-                            "match_type": "filename"
-                        })
-                    
-                    # Check content match for text files
-                    elif item.suffix.lower() in ['.txt', '.py', '.js', '.html', '.css', '.json', '.md']:
-                        try:
-                            with open(item, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                if query.lower() in content.lower():
-                                    matches.append({
-                                        "path": str(item),
-                                        "name": item.name,
-                                        "size": item.stat().st_size,
-                                        "match_type": "content"
-                                    })
-                        except:
-                            continue
+            # Traversal and file reads block, so run them off the event loop
+            loop = asyncio.get_running_loop()
+            matches = await loop.run_in_executor(None, self._collect_matches, str(path), pattern, query)
             
             return {
                 "success": True,
@@ -528,6 +611,47 @@ class AdvancedFileManager:
             logger.error(f"Error searching files: {e}")
             return {"success": False, "error": str(e)}
     
+    def _collect_matches(self, directory: str, name_pattern: str, query: str) -> List[Dict[str, Any]]:
+        """Find files under directory matching query by name or content (runs in a worker thread)."""
+        matches = []
+        query_lower = query.lower()
+        
+        # Bytes regex with IGNORECASE folds ASCII case only, so non-ASCII queries read text
+        content_pattern = None
+        if query.isascii():
+            content_pattern = re.compile(re.escape(query.encode("ascii")), re.IGNORECASE)
+        
+        for entry in _walk(directory, name_pattern, recursive=True):
+            try:
+                if not entry.is_file():
+                    continue
+                name = entry.name
+                
+                # Check filename match
+                if query_lower in name.lower():
+                    matches.append({
+                        "path": entry.path,
+                        "name": name,
+                        "size": entry.stat().st_size,
+                        "match_type": "filename"
+                    })
+                
+                # Check content match for text files
+                elif os.path.splitext(name)[1].lower() in ['.txt', '.py', '.js', '.html', '.css', '.json', '.md']:
+                    size = entry.stat().st_size
+                    if _file_contains(entry.path, size, query_lower, content_pattern):
+                        matches.append({
+                            "path": entry.path,
+                            "name": name,
+                            "size": size,
+                            "match_type": "content"
+                        })
+            except OSError:
+                # Skip files we can't access
+                continue
+        
+        return matches
+    
     @staticmethod
     def _format_size(size_bytes: int) -> str:
         """Format file size in human readable format."""
@@ -564,14 +688,15 @@ class ScreenCapture:
             
             # Save screenshot
             screenshot.save(save_path)
+            file_size = save_path.stat().st_size
             
             return {
                 "success": True,
                 "path": str(save_path),
                 "size": screenshot.size,
                 "mode": screenshot.mode,
-                "file_size": save_path.stat().st_size,
-                "file_size_human": AdvancedFileManager._format_size(save_path.stat().st_size)
+                "file_size": file_size,
+                "file_size_human": AdvancedFileManager._format_size(file_size)
             }
             
         except Exception as e:
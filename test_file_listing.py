@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test file listing patterns in the file manager.
+Checks that name patterns and path patterns ("a/*", "**/*.py") both match like Path.glob.
+"""
+
+import sys
+import os
+sys.path.insert(0, 'src')
+
+import asyncio
+import tempfile
+from pathlib import Path
+from jarvis.tools.action_dispatcher import AdvancedFileManager, SafetyManager, TempFileManager
+
+
+def make_tree(root: Path) -> None:
+    """Create a small directory tree to list."""
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "top.py").write_text("print('top')\n")
+    (root / "notes.txt").write_text("notes\n")
+    (root / "a" / "inner.py").write_text("print('inner')\n")
+    (root / "a" / "data.json").write_text("{}\n")
+    (root / "a" / "b" / "deep.py").write_text("print('deep')\n")
+
+
+def names(result: dict) -> set:
+    """Return the relative paths of all listed files and directories."""
+    assert result["success"], result.get("error")
+    root = Path(result["directory"])
+    return {Path(item["path"]).relative_to(root).as_posix() for item in result["files"] + result["directories"]}
+
+
+def expected(root: Path, pattern: str, recursive: bool) -> set:
+    """Return what Path.glob/rglob finds for the same pattern."""
+    paths = root.rglob(pattern) if recursive else root.glob(pattern)
+    return {path.relative_to(root).as_posix() for path in paths}
+
+
+async def test_file_listing():
+    """Compare list_files against Path.glob for name and path patterns."""
+    print("📂 Testing file listing patterns")
+    print("=" * 50)
+
+    file_manager = AdvancedFileManager(TempFileManager(), SafetyManager())
+    cases = [
+        ("*.py", False),
+        ("*.py", True),
+        ("a/*", False),
+        ("a/*", True),
+        ("**/*.py", False),
+        ("**/*.py", True),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp).resolve()
+        make_tree(root)
+
+        for pattern, recursive in cases:
+            result = await file_manager.list_files(str(root), pattern, recursive)
+            listed = names(result)
+            assert listed == expected(root, pattern, recursive), f"{pattern!r} recursive={recursive}: {sorted(listed)}"
+            assert listed, f"{pattern!r} recursive={recursive} matched nothing"
+            print(f"✅ {pattern!r} (recursive={recursive}): {sorted(listed)}")
+
+    print("\n🎉 All listing tests passed")
+
+
+if __name__ == "__main__":
+    asyncio.run(test_file_listing())